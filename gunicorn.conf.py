@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for running the WaveWatch API in production
+
+Usage: gunicorn -c gunicorn.conf.py
+(`python surf_api.py` is still available for local development)
+"""
+
+import multiprocessing
+
+wsgi_app = "surf_api:app"
+bind = "0.0.0.0:8001"
+
+# One independent event loop per worker; uvicorn picks uvloop/httptools when installed
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Hold idle connections open longer than the typical proxy/browser keep-alive window
+keepalive = 75
+
+# Each worker imports the app itself: the logging listener thread started at import time
+# would not survive a fork (clients and services are created per worker in the lifespan)
+preload_app = False
@@ -29,6 +29,7 @@ echo "✅ Python and Node.js are installed"
 # Install Python dependencies
 echo "📦 Installing Python dependencies..."
 pip install -r requirements.txt
+pip install -e .
 
 # Install Node.js dependencies for React client
 echo "📦 Installing React client dependencies..."
@@ -5,24 +5,277 @@ Fetches swell, wind, tide, and other surf data in a single API call.
 
 import os
 import json
+import logging
+import math
+import sqlite3
 import time
+import asyncio
+import threading
+import weakref
+import numpy as np
 import requests
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional, Tuple
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; without it only gzip and deflate are requested
+    brotli = None
+
+try:
+    import aiohttp
+    _ASYNC_NETWORK_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+except ImportError:  # aiohttp is only needed for the async fetch methods
+    aiohttp = None
+    _ASYNC_NETWORK_ERRORS = (asyncio.TimeoutError,)
+
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Sentinel keys for beach name prefix trie nodes (never valid single characters)
+_TRIE_KEY = 'key'
+_TRIE_FIRST = 'first'
+
+# NOAA CO-OPS endpoints
+_NOAA_METADATA_URL = "https://api.tidesandcurrents.noaa.gov/mdapi/prod/webapi/stations/{station_id}.json"
+_NOAA_PREDICTIONS_URL = (
+    "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter?"
+    "product=predictions&application=NOS.COOPS.TAC.WL&"
+    "station={station_id}&begin_date={date_str}&end_date={date_str}&"
+    "datum=MLLW&interval=hilo&units=metric&time_zone=gmt&format=json"
+)
+
+
+# Content codings requested from Stormglass and NOAA. Only list codings that both requests
+# (via urllib3) and aiohttp can decode here: br needs the brotli package
+_ACCEPT_ENCODING = 'gzip, deflate, br' if brotli is not None else 'gzip, deflate'
+
+# (connect, read) timeouts in seconds; a short connect timeout fails fast on unreachable
+# hosts so the retry policy can kick in, while reads keep their full budget
+_CONNECT_TIMEOUT = 3.05
+_WEATHER_TIMEOUT = (_CONNECT_TIMEOUT, 30)
+_NOAA_TIMEOUT = (_CONNECT_TIMEOUT, 10)
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON document from raw bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode an object as single-line JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# Stormglass fields reported in current conditions
+_NOAA_KEYS = (
+    'waveHeight', 'wavePeriod', 'waveDirection', 'windSpeed', 'windDirection', 'waterTemperature',
+    'airTemperature', 'pressure', 'humidity', 'visibility', 'cloudCover', 'precipitation'
+)
+
+# Stormglass fields reported as-is in hourly conditions, in unpacking order
+_PASSTHROUGH_FIELDS = (
+    'waveDirection', 'wavePeriod', 'windDirection', 'pressure', 'humidity', 'cloudCover', 'precipitation'
+)
+
+
+def _default_cache_file() -> str:
+    """Return the surf data cache path under the user cache directory (XDG_CACHE_HOME or ~/.cache)."""
+    cache_home = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'wavewatch', 'surf_data_cache.db')
+
+
+def _canonical_beach_name(name: str) -> str:
+    """Normalize a beach name for lookups: lowercase with single spaces between words."""
+    return ' '.join(name.lower().split())
+
+
+def _parse_noaa_ts(timestamp: str) -> datetime:
+    """Parse a NOAA 'YYYY-MM-DD HH:MM' or 'YYYY-MM-DD HH:MM:SS' timestamp by slicing fixed fields."""
+    second = int(timestamp[17:19]) if len(timestamp) > 16 else 0
+    return datetime(
+        int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+        int(timestamp[11:13]), int(timestamp[14:16]), second
+    )
+
+
+def _noaa(hour: dict, key: str, default: Any = 'N/A') -> Any:
+    """Return an hour's NOAA value for a Stormglass field, or default if it is missing."""
+    field = hour.get(key)
+    return field['noaa'] if field and 'noaa' in field else default
+
+
+def _metric_array(hours: list, key: str) -> np.ndarray:
+    """Collect one NOAA metric across all hours as a float array (NaN where missing)."""
+    return np.fromiter(
+        (_noaa(hour, key, np.nan) for hour in hours),
+        dtype=np.float64,
+        count=len(hours)
+    )
+
+
+def _rounded_with_na(values: np.ndarray) -> list:
+    """Convert a float array to a list rounded to one decimal, replacing NaN with the 'N/A' sentinel."""
+    # Python's round (not np.round) so values match the scalar conversions, e.g. 68.45 -> 68.5
+    return ['N/A' if math.isnan(value) else round(value, 1) for value in values.tolist()]
+
+
+# Mapping of beaches to NOAA tide stations (use actual station IDs)
+_TIDE_STATIONS: Mapping[str, str] = MappingProxyType({
+    "pleasure point": "9413745",  # Santa Cruz, CA
+    "santa cruz": "9413745",      # Santa Cruz, CA
+    "malibu": "9410660",         # Los Angeles, CA
+    "pipeline": "1612340",       # Honolulu, HI
+    "trestles": "9410660",       # Los Angeles, CA (closest)
+    "mavericks": "9413450",      # Half Moon Bay, CA
+    "huntington beach": "9410660", # Los Angeles, CA
+    "venice beach": "9410660",   # Los Angeles, CA
+    "manhattan beach": "9410660", # Los Angeles, CA
+    "hermosa beach": "9410660",  # Los Angeles, CA
+    "redondo beach": "9410660", # Los Angeles, CA
+    "el segundo": "9410660",    # Los Angeles, CA
+    "scripps": "9410230",       # La Jolla, CA
+    "tourmaline": "9410230",    # La Jolla, CA
+    "linda mar": "9414290",     # San Francisco, CA (Presidio - closest to Pacifica)
+})
+
+# Common surf beach coordinates (lat, lng)
+_BEACH_COORDINATES: Mapping[str, Tuple[float, float]] = MappingProxyType({
+    "pleasure point": (36.9514, -122.0256),
+    "malibu": (34.0259, -118.7798),
+    "pipeline": (21.6611, -158.0536),
+    "trestles": (33.3703, -117.5681),
+    "mavericks": (37.4897, -122.4993),
+    "huntington beach": (33.6595, -117.9988),
+    "venice beach": (33.9850, -118.4695),
+    "manhattan beach": (33.8847, -118.4109),
+    "hermosa beach": (33.8622, -118.3991),
+    "redondo beach": (33.8492, -118.3881),
+    "el segundo": (33.9192, -118.4165),
+    "torrance beach": (33.8036, -118.3931),
+    "palos verdes": (33.7444, -118.3878),
+    "rancho palos verdes": (33.7444, -118.3878),
+    "san onofre": (33.3703, -117.5681),
+    "san onofre state beach": (33.3703, -117.5681),
+    "doheny": (33.4625, -117.7142),
+    "doheny state beach": (33.4625, -117.7142),
+    "salt creek": (33.4625, -117.7142),
+    "san clemente": (33.3703, -117.5681),
+    "laguna beach": (33.5427, -117.7854),
+    "newport beach": (33.6189, -117.9298),
+    "seal beach": (33.7414, -118.1048),
+    "long beach": (33.7701, -118.1937),
+    "sunset beach": (33.7167, -118.0833),
+    "bolsa chica": (33.7414, -118.1048),
+    "huntington state beach": (33.6595, -117.9988),
+    "crystal cove": (33.5427, -117.7854),
+    "corona del mar": (33.6189, -117.9298),
+    "balboa": (33.6189, -117.9298),
+    "newport pier": (33.6189, -117.9298),
+    "blackies": (33.6189, -117.9298),
+    "the wedge": (33.6189, -117.9298),
+    "trails": (33.3703, -117.5681),
+    "old man's": (33.3703, -117.5681),
+    "church": (33.3703, -117.5681),
+    "middles": (33.3703, -117.5681),
+    "cottons": (33.3703, -117.5681),
+    "upper trestles": (33.3703, -117.5681),
+    "lower trestles": (33.3703, -117.5681),
+    "uppers": (33.3703, -117.5681),
+    "lowers": (33.3703, -117.5681),
+    "scripps": (32.8667, -117.2500),
+    "tourmaline": (32.8000, -117.2667),
+    "linda mar": (37.5986, -122.5006),  # Pacifica, CA
+})
+
+
+def _build_beach_index(beach_coordinates: Mapping[str, Tuple[float, float]]) -> Tuple[Dict, Dict[str, str]]:
+    """
+    Build the indexes used for partial beach name lookups.
+    
+    Args:
+        beach_coordinates: Mapping of beach names to coordinates
+        
+    Returns:
+        Tuple of (prefix trie, token index). Each trie node maps characters to
+        child nodes, with the first key below the node stored under _TRIE_FIRST
+        and a complete key stored under _TRIE_KEY. The token index maps words
+        that identify a single location to one beach key.
+    """
+    trie: Dict = {}
+    for key in beach_coordinates:
+        node = trie
+        node.setdefault(_TRIE_FIRST, key)
+        for char in key:
+            node = node.setdefault(char, {})
+            node.setdefault(_TRIE_FIRST, key)
+        node[_TRIE_KEY] = key
+    
+    # Only keep words that resolve to one location ("trestles", "onofre"),
+    # not generic ones shared by different spots ("beach", "state")
+    token_keys: Dict[str, str] = {}
+    ambiguous = set()
+    for key, coords in beach_coordinates.items():
+        for token in key.split():
+            first_key = token_keys.setdefault(token, key)
+            if beach_coordinates[first_key] != coords:
+                ambiguous.add(token)
+    for token in ambiguous:
+        del token_keys[token]
+    
+    return trie, token_keys
+
+
+# Beach lookup indexes, built once from the coordinate table
+_CANON_COORDS: Mapping[str, Tuple[float, float]] = MappingProxyType(
+    {_canonical_beach_name(key): coords for key, coords in _BEACH_COORDINATES.items()}
+)
+_BEACH_PREFIX_TRIE, _BEACH_TOKENS = _build_beach_index(_CANON_COORDS)
+
+
 class StormglassDataFetcher:
     """Fetches surf data from Stormglass.io API with caching."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Stormglass weather parameters requested for every point forecast
+    _WEATHER_PARAMS: ClassVar[str] = ','.join((
+        'waveHeight',      # Wave height
+        'waveDirection',   # Wave direction
+        'wavePeriod',      # Wave period
+        'windSpeed',       # Wind speed
+        'windDirection',   # Wind direction
+        'waterTemperature', # Water temperature
+        'airTemperature',  # Air temperature
+        'pressure',        # Atmospheric pressure
+        'humidity',        # Humidity
+        'visibility',      # Visibility
+        'cloudCover',     # Cloud cover
+        'precipitation'   # Precipitation
+    ))
+    
+    def __init__(self, api_key: Optional[str] = None, cache_file: Optional[str] = None):
         """
         Initialize the data fetcher.
         
         Args:
             api_key: Stormglass API key. If None, will try to get from environment.
+            cache_file: Path of the SQLite cache database. If None, uses WAVEWATCH_CACHE_DB
+                from the environment, falling back to the user cache directory.
         """
         if api_key is None:
             api_key = os.getenv('STORMGLASS_API_KEY')
@@ -31,97 +284,141 @@ class StormglassDataFetcher:
             raise ValueError("Stormglass API key is required. Set STORMGLASS_API_KEY environment variable or pass api_key parameter.")
         
         self.api_key = api_key
+        self._headers = {
+            'Authorization': self.api_key
+        }
         self.base_url = "https://api.stormglass.io/v2"
-        self.cache_file = "surf_data_cache.json"
+        if cache_file is None:
+            cache_file = os.getenv('WAVEWATCH_CACHE_DB') or _default_cache_file()
+        self.cache_file = cache_file
         self.cache_expiry = 86400  # 24 hours in seconds
         
+        # SQLite cache store (WAL mode, safe to share between processes)
+        self._cache_lock = threading.Lock()
+        self._cache_db = self._open_cache()
+        
+        # Shared HTTP session so repeated calls reuse keep-alive connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False  # Hand the final response back so status codes are reported as before
+            )
+        )
+        self._session.mount('https://', adapter)
+        # Ask for compressed responses; includes br when a brotli decoder is installed
+        self._session.headers.update({'Accept-Encoding': _ACCEPT_ENCODING})
+        
+        # Worker threads for overlapping independent Stormglass and NOAA requests
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        
         # Mapping of beaches to NOAA tide stations (use actual station IDs)
-        self.tide_stations = {
-            "pleasure point": "9413745",  # Santa Cruz, CA
-            "santa cruz": "9413745",      # Santa Cruz, CA
-            "malibu": "9410660",         # Los Angeles, CA
-            "pipeline": "1612340",       # Honolulu, HI
-            "trestles": "9410660",       # Los Angeles, CA (closest)
-            "mavericks": "9413450",      # Half Moon Bay, CA
-            "huntington beach": "9410660", # Los Angeles, CA
-            "venice beach": "9410660",   # Los Angeles, CA
-            "manhattan beach": "9410660", # Los Angeles, CA
-            "hermosa beach": "9410660",  # Los Angeles, CA
-            "redondo beach": "9410660", # Los Angeles, CA
-            "el segundo": "9410660",    # Los Angeles, CA
-            "scripps": "9410230",       # La Jolla, CA
-            "tourmaline": "9410230",    # La Jolla, CA
-            "linda mar": "9414290",     # San Francisco, CA (Presidio - closest to Pacifica)
-        }
+        self.tide_stations = _TIDE_STATIONS
         
         # Cache for station metadata (to avoid repeated API calls)
         self._station_metadata_cache = {}
         
+        # LRU cache of tide predictions keyed by (station_id, date_str); a day's predictions never change
+        self._predictions_cache = OrderedDict()
+        self._predictions_cache_size = 512
+        self._predictions_lock = threading.Lock()
+        
+        # aiohttp sessions for the async methods, created lazily per event loop
+        # (a session is bound to the loop it was created in and cannot be reused elsewhere)
+        self._async_sessions = weakref.WeakKeyDictionary()
+        
         # Common surf beach coordinates (lat, lng)
-        self.beach_coordinates = {
-            "pleasure point": (36.9514, -122.0256),
-            "malibu": (34.0259, -118.7798),
-            "pipeline": (21.6611, -158.0536),
-            "trestles": (33.3703, -117.5681),
-            "mavericks": (37.4897, -122.4993),
-            "huntington beach": (33.6595, -117.9988),
-            "venice beach": (33.9850, -118.4695),
-            "manhattan beach": (33.8847, -118.4109),
-            "hermosa beach": (33.8622, -118.3991),
-            "redondo beach": (33.8492, -118.3881),
-            "el segundo": (33.9192, -118.4165),
-            "torrance beach": (33.8036, -118.3931),
-            "palos verdes": (33.7444, -118.3878),
-            "rancho palos verdes": (33.7444, -118.3878),
-            "san onofre": (33.3703, -117.5681),
-            "san onofre state beach": (33.3703, -117.5681),
-            "doheny": (33.4625, -117.7142),
-            "doheny state beach": (33.4625, -117.7142),
-            "salt creek": (33.4625, -117.7142),
-            "san clemente": (33.3703, -117.5681),
-            "laguna beach": (33.5427, -117.7854),
-            "newport beach": (33.6189, -117.9298),
-            "seal beach": (33.7414, -118.1048),
-            "long beach": (33.7701, -118.1937),
-            "sunset beach": (33.7167, -118.0833),
-            "bolsa chica": (33.7414, -118.1048),
-            "huntington state beach": (33.6595, -117.9988),
-            "crystal cove": (33.5427, -117.7854),
-            "corona del mar": (33.6189, -117.9298),
-            "balboa": (33.6189, -117.9298),
-            "newport pier": (33.6189, -117.9298),
-            "blackies": (33.6189, -117.9298),
-            "the wedge": (33.6189, -117.9298),
-            "trails": (33.3703, -117.5681),
-            "old man's": (33.3703, -117.5681),
-            "church": (33.3703, -117.5681),
-            "middles": (33.3703, -117.5681),
-            "cottons": (33.3703, -117.5681),
-            "upper trestles": (33.3703, -117.5681),
-            "lower trestles": (33.3703, -117.5681),
-            "uppers": (33.3703, -117.5681),
-            "lowers": (33.3703, -117.5681),
-            "scripps": (32.8667, -117.2500),
-            "tourmaline": (32.8000, -117.2667),
-            "linda mar": (37.5986, -122.5006),  # Pacifica, CA
-        }
+        self.beach_coordinates = _BEACH_COORDINATES
+        
+        # Lookup indexes keyed by canonical beach names (lowercase, single-spaced)
+        self._canon_coords = _CANON_COORDS
+        self._beach_prefix_trie = _BEACH_PREFIX_TRIE
+        self._beach_tokens = _BEACH_TOKENS
+    
+    def close(self) -> None:
+        """Release pooled HTTP connections, worker threads and the cache database."""
+        self._executor.shutdown(wait=True)
+        self._session.close()
+        with self._cache_lock:
+            if self._cache_db is not None:
+                self._cache_db.close()
+                self._cache_db = None
+    
+    async def aclose(self) -> None:
+        """Close the aiohttp session the async methods use in the running event loop."""
+        session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+    
+    async def _get_async_session(self) -> 'aiohttp.ClientSession':
+        """Return the aiohttp session for the running event loop, creating it on first use."""
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for async fetching. Install with: pip install aiohttp")
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=30),
+                headers={'Accept-Encoding': _ACCEPT_ENCODING}
+            )
+            self._async_sessions[loop] = session
+        return session
+    
+    def _open_cache(self) -> Optional[sqlite3.Connection]:
+        """Open the cache database, creating the table and dropping expired rows."""
+        try:
+            cache_dir = os.path.dirname(self.cache_file)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            connection = sqlite3.connect(self.cache_file, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, data BLOB, tide BLOB, ts REAL)"
+            )
+            connection.execute("DELETE FROM cache WHERE ts <= ?", (time.time() - self.cache_expiry,))
+            return connection
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Could not open cache database: {e}")
+            return None
     
-    def _load_cache(self) -> Dict:
-        """Load cached data from file."""
+    def _load_cache(self, key: str) -> Optional[Dict]:
+        """Load an unexpired cache entry for a key, or None on a miss."""
         try:
-            if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r') as file:
-                    return json.load(file)
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
-        return {}
-    
-    def _save_cache(self, cache: Dict) -> None:
-        """Save data to cache file."""
+            with self._cache_lock:
+                if self._cache_db is None:
+                    return None
+                row = self._cache_db.execute(
+                    "SELECT data, tide, ts FROM cache WHERE key = ? AND ts > ?",
+                    (key, time.time() - self.cache_expiry)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not read cache: {e}")
+            return None
+        if row is None:
+            return None
+        data, tide, timestamp = row
+        return {
+            'data': _json_loads(data),
+            'tide_data': _json_loads(tide) if tide else {},
+            'timestamp': timestamp
+        }
+    
+    def _save_cache(self, key: str, entry: Dict) -> None:
+        """Insert or replace the cache entry for a key."""
         try:
-            with open(self.cache_file, 'w') as file:
-                json.dump(cache, file, indent=2)
-        except Exception as e:
+            with self._cache_lock:
+                if self._cache_db is None:
+                    return
+                self._cache_db.execute(
+                    "INSERT OR REPLACE INTO cache (key, data, tide, ts) VALUES (?, ?, ?, ?)",
+                    (key, _json_dumps(entry['data']), _json_dumps(entry['tide_data']), entry['timestamp'])
+                )
+        except sqlite3.Error as e:
             print(f"Warning: Could not save cache: {e}")
     
     def _get_beach_coordinates(self, beach_name: str) -> Optional[Tuple[float, float]]:
@@ -134,18 +431,57 @@ class StormglassDataFetcher:
         Returns:
             Tuple of (latitude, longitude) or None if not found
         """
-        # Try exact match first
-        beach_key = beach_name.lower().strip()
-        if beach_key in self.beach_coordinates:
-            return self.beach_coordinates[beach_key]
+        # Try exact match on the canonical name first ("Venice  Beach " -> "venice beach")
+        beach_key = _canonical_beach_name(beach_name)
+        coords = self._canon_coords.get(beach_key)
+        if coords is not None:
+            return coords
         
-        # Try partial matches
-        for key, coords in self.beach_coordinates.items():
-            if beach_key in key or key in beach_key:
-                return coords
+        # Walk the prefix trie: either the name is the start of a known beach
+        # ("huntington") or a known beach is the start of the name ("malibu pier")
+        node = self._beach_prefix_trie
+        longest_prefix_key = None
+        for char in beach_key:
+            node = node.get(char)
+            if node is None:
+                break
+            longest_prefix_key = node.get(_TRIE_KEY, longest_prefix_key)
+        else:
+            return self._canon_coords[node[_TRIE_FIRST]]
+        if longest_prefix_key is not None:
+            return self._canon_coords[longest_prefix_key]
         
+        # Fall back to matching a distinctive word of the name
+        for token in beach_key.split():
+            key = self._beach_tokens.get(token)
+            if key is not None:
+                return self._canon_coords[key]
+        
+        return None
+    
+    @staticmethod
+    def _station_metadata_from_response(data: Dict) -> Optional[Dict]:
+        """Extract station type, reference station and offsets URL from a NOAA metadata response."""
+        # The API returns stations as a list, get the first one
+        if 'stations' in data and len(data['stations']) > 0:
+            station_info = data['stations'][0]
+            return {
+                'type': station_info.get('type', ''),  # 'R' or 'S'
+                'reference_id': station_info.get('reference_id'),
+                'tidepredoffsets_url': station_info.get('tidepredoffsets', {}).get('self') if isinstance(station_info.get('tidepredoffsets'), dict) else None
+            }
         return None
     
+    @staticmethod
+    def _offsets_from_response(offsets_data: Dict) -> Dict:
+        """Extract time and height offsets from a NOAA tide prediction offsets response."""
+        return {
+            'time_high': offsets_data.get('timeOffsetHighTide', 0),
+            'time_low': offsets_data.get('timeOffsetLowTide', 0),
+            'height_high': offsets_data.get('heightOffsetHighTide', 1.0),
+            'height_low': offsets_data.get('heightOffsetLowTide', 1.0)
+        }
+    
     def _get_station_metadata(self, station_id: str) -> Optional[Dict]:
         """
         Get station metadata from NOAA Metadata API.
@@ -167,32 +503,17 @@ class StormglassDataFetcher:
         
         try:
             # Fetch station metadata from NOAA Metadata API
-            metadata_url = f"https://api.tidesandcurrents.noaa.gov/mdapi/prod/webapi/stations/{station_id}.json"
-            response = requests.get(metadata_url, timeout=10)
+            response = self._session.get(_NOAA_METADATA_URL.format(station_id=station_id), timeout=_NOAA_TIMEOUT)
             
             if response.status_code == 200:
-                data = response.json()
-                # The API returns stations as a list, get the first one
-                if 'stations' in data and len(data['stations']) > 0:
-                    station_info = data['stations'][0]
-                    metadata = {
-                        'type': station_info.get('type', ''),  # 'R' or 'S'
-                        'reference_id': station_info.get('reference_id'),
-                        'tidepredoffsets_url': station_info.get('tidepredoffsets', {}).get('self') if isinstance(station_info.get('tidepredoffsets'), dict) else None
-                    }
-                    
+                metadata = self._station_metadata_from_response(_json_loads(response.content))
+                if metadata:
                     # If this is a subordinate station, fetch the actual offset values
                     if metadata['type'] == 'S' and metadata['tidepredoffsets_url']:
                         try:
-                            offsets_response = requests.get(metadata['tidepredoffsets_url'], timeout=10)
+                            offsets_response = self._session.get(metadata['tidepredoffsets_url'], timeout=_NOAA_TIMEOUT)
                             if offsets_response.status_code == 200:
-                                offsets_data = offsets_response.json()
-                                metadata['tidepredoffsets'] = {
-                                    'time_high': offsets_data.get('timeOffsetHighTide', 0),
-                                    'time_low': offsets_data.get('timeOffsetLowTide', 0),
-                                    'height_high': offsets_data.get('heightOffsetHighTide', 1.0),
-                                    'height_low': offsets_data.get('heightOffsetLowTide', 1.0)
-                                }
+                                metadata['tidepredoffsets'] = self._offsets_from_response(_json_loads(offsets_response.content))
                         except Exception as e:
                             print(f"Warning: Could not fetch tide offsets for {station_id}: {e}")
                     
@@ -204,6 +525,232 @@ class StormglassDataFetcher:
             print(f"Warning: Could not fetch station metadata for {station_id}: {e}")
             return None
     
+    async def _aget_station_metadata(self, station_id: str) -> Optional[Dict]:
+        """Async variant of _get_station_metadata, sharing the same metadata cache."""
+        if station_id in self._station_metadata_cache:
+            return self._station_metadata_cache[station_id]
+        
+        try:
+            session = await self._get_async_session()
+            timeout = aiohttp.ClientTimeout(total=_NOAA_TIMEOUT[1], connect=_CONNECT_TIMEOUT)
+            async with session.get(_NOAA_METADATA_URL.format(station_id=station_id), timeout=timeout) as response:
+                if response.status != 200:
+                    return None
+                metadata = self._station_metadata_from_response(_json_loads(await response.read()))
+            if not metadata:
+                return None
+            
+            if metadata['type'] == 'S' and metadata['tidepredoffsets_url']:
+                try:
+                    async with session.get(metadata['tidepredoffsets_url'], timeout=timeout) as offsets_response:
+                        if offsets_response.status == 200:
+                            metadata['tidepredoffsets'] = self._offsets_from_response(_json_loads(await offsets_response.read()))
+                except Exception as e:
+                    print(f"Warning: Could not fetch tide offsets for {station_id}: {e}")
+            
+            self._station_metadata_cache[station_id] = metadata
+            return metadata
+        except Exception as e:
+            print(f"Warning: Could not fetch station metadata for {station_id}: {e}")
+            return None
+    
+    @staticmethod
+    def _predictions_from_response(predictions_data: Dict) -> Tuple[Tuple[str, str, float], ...]:
+        """Convert a NOAA predictions response into (time string, tide type, height in meters) records."""
+        predictions_list = predictions_data.get('predictions', [])
+        return tuple(
+            (pred.get('t', ''), pred.get('type', '').upper(), float(pred.get('v', 0)))
+            for pred in predictions_list
+        )
+    
+    def _cached_predictions(self, key: Tuple[str, str]) -> Optional[Tuple[Tuple[str, str, float], ...]]:
+        """Look up memoized predictions, marking them as recently used."""
+        with self._predictions_lock:
+            predictions = self._predictions_cache.get(key)
+            if predictions is not None:
+                self._predictions_cache.move_to_end(key)
+            return predictions
+    
+    def _remember_predictions(self, key: Tuple[str, str], predictions: Tuple[Tuple[str, str, float], ...]) -> None:
+        """Memoize predictions, evicting the least recently used entry when full."""
+        with self._predictions_lock:
+            self._predictions_cache[key] = predictions
+            self._predictions_cache.move_to_end(key)
+            if len(self._predictions_cache) > self._predictions_cache_size:
+                self._predictions_cache.popitem(last=False)
+    
+    def _fetch_predictions(self, station_id: str, date_str: str) -> Tuple[Tuple[str, str, float], ...]:
+        """
+        Fetch high/low tide predictions for a station and day from the NOAA API.
+        Predictions for a given day never change, so results are memoized.
+        Failures raise, and empty or error responses are returned without being cached.
+        
+        Args:
+            station_id: NOAA station ID
+            date_str: Date in YYYYMMDD format
+            
+        Returns:
+            Tuple of (time string, tide type, height in meters) records
+        """
+        key = (station_id, date_str)
+        predictions = self._cached_predictions(key)
+        if predictions is None:
+            predictions_url = _NOAA_PREDICTIONS_URL.format(station_id=station_id, date_str=date_str)
+            predictions_response = self._session.get(predictions_url, timeout=_NOAA_TIMEOUT)
+            predictions_response.raise_for_status()
+            predictions_data = _json_loads(predictions_response.content)
+            predictions = self._predictions_from_response(predictions_data)
+            if predictions and 'error' not in predictions_data:
+                self._remember_predictions(key, predictions)
+        return predictions
+    
+    async def _afetch_predictions(self, station_id: str, date_str: str) -> Tuple[Tuple[str, str, float], ...]:
+        """Async variant of _fetch_predictions, sharing the same predictions cache."""
+        key = (station_id, date_str)
+        predictions = self._cached_predictions(key)
+        if predictions is None:
+            session = await self._get_async_session()
+            predictions_url = _NOAA_PREDICTIONS_URL.format(station_id=station_id, date_str=date_str)
+            async with session.get(predictions_url, timeout=aiohttp.ClientTimeout(total=_NOAA_TIMEOUT[1], connect=_CONNECT_TIMEOUT)) as predictions_response:
+                predictions_response.raise_for_status()
+                predictions_data = _json_loads(await predictions_response.read())
+            predictions = self._predictions_from_response(predictions_data)
+            if predictions and 'error' not in predictions_data:
+                self._remember_predictions(key, predictions)
+        return predictions
+    
+    @staticmethod
+    def _tide_date_str(target_date) -> str:
+        """Return the target date (or today) in the YYYYMMDD format NOAA expects."""
+        # Parse target date or use current date
+        if target_date:
+            if isinstance(target_date, str):
+                date_obj = datetime.strptime(target_date, '%Y-%m-%d')
+            else:
+                date_obj = target_date  # Already a datetime object
+        else:
+            # Today's weather window is the UTC day (see _weather_params), so match its tides
+            date_obj = datetime.now(timezone.utc)
+        
+        # Ensure we have a datetime object for processing
+        if not isinstance(date_obj, datetime):
+            date_obj = datetime.strptime(str(date_obj), '%Y-%m-%d')
+        
+        return date_obj.strftime('%Y%m%d')
+    
+    @staticmethod
+    def _reference_station_id(station_metadata: Optional[Dict]) -> Optional[str]:
+        """Return the reference station ID if the station is subordinate, else None."""
+        if station_metadata and station_metadata.get('type') == 'S' and station_metadata.get('reference_id'):
+            return station_metadata['reference_id']
+        return None
+    
+    @staticmethod
+    def _build_tide_data(station_id: str, station_metadata: Optional[Dict], predictions: Tuple[Tuple[str, str, float], ...]) -> Dict:
+        """
+        Convert high/low tide predictions into our tide data format.
+        For subordinate stations the predictions come from the reference station
+        and the station's time and height offsets are applied.
+        
+        Args:
+            station_id: NOAA station ID for the beach
+            station_metadata: Metadata from _get_station_metadata (may be None)
+            predictions: Prediction records for the station (or its reference station)
+            
+        Returns:
+            Dictionary with tide data or error information
+        """
+        reference_station_id = StormglassDataFetcher._reference_station_id(station_metadata)
+        
+        if reference_station_id:
+            # This is a subordinate station - predictions are from the reference station
+            if not predictions:
+                return {'error': f'No tide predictions available from reference station {reference_station_id}'}
+            
+            offsets = station_metadata.get('tidepredoffsets', {})
+            
+            # Extract offset values from the metadata
+            offsets_dict = offsets if isinstance(offsets, dict) else {}
+            time_high = offsets_dict.get('time_high', 0)
+            time_low = offsets_dict.get('time_low', 0)
+            height_high = offsets_dict.get('height_high', 1.0)
+            height_low = offsets_dict.get('height_low', 1.0)
+            
+            # Apply offsets to high/low tides
+            high_low_tides = []
+            for tide_time_str, tide_type, tide_value_m in predictions:
+                # tide_type is 'H' for high, 'L' for low
+                tide_value_ft = tide_value_m * 3.28084  # Convert to feet
+                
+                # Parse time (format: YYYY-MM-DD HH:MM, optionally with :SS)
+                tide_time = _parse_noaa_ts(tide_time_str)
+                
+                # Apply height offset
+                if tide_type == 'H':  # High tide
+                    tide_value_ft = tide_value_ft * height_high
+                    time_offset = time_high
+                else:  # Low tide
+                    tide_value_ft = tide_value_ft * height_low
+                    time_offset = time_low
+                
+                # Apply time offset
+                adjusted_time = tide_time + timedelta(minutes=time_offset)
+                
+                high_low_tides.append({
+                    'time': adjusted_time,
+                    'tide': tide_value_ft,
+                    'reference_station': reference_station_id
+                })
+            
+            # Return only high/low tide points (no interpolation)
+            tide_conditions = []
+            for tide in high_low_tides:
+                tide_conditions.append({
+                    'time': tide['time'].strftime('%Y-%m-%dT%H:%M:%S+00:00'),
+                    'tide': round(tide['tide'], 2)
+                })
+            
+            return {
+                'tide_conditions': tide_conditions,
+                'station_id': station_id,
+                'reference_station_id': reference_station_id,
+                'station_name': f'Station {station_id} (subordinate, ref: {reference_station_id})'
+            }
+        
+        # This is a harmonic station - high/low predictions (not hourly water level)
+        if not predictions:
+            return {'error': f'No tide predictions available for station {station_id}'}
+        
+        # Convert to our format
+        tide_conditions = []
+        for tide_time_str, _, tide_value_m in predictions:
+            tide_value_ft = tide_value_m * 3.28084  # Convert to feet
+            
+            # Parse time
+            tide_time = _parse_noaa_ts(tide_time_str)
+            
+            tide_conditions.append({
+                'time': tide_time.strftime('%Y-%m-%dT%H:%M:%S+00:00'),
+                'tide': round(tide_value_ft, 2)
+            })
+        
+        return {
+            'tide_conditions': tide_conditions,
+            'station_id': station_id,
+            'station_name': f'Station {station_id}'
+        }
+    
+    @staticmethod
+    def _predictions_error(station_id: str, reference_station_id: Optional[str], error: Exception, status: Optional[int] = None) -> Dict:
+        """Build the error result for a failed predictions request."""
+        if status is not None:
+            if reference_station_id:
+                return {'error': f'Failed to fetch predictions from reference station {reference_station_id}: HTTP {status}'}
+            return {'error': f'Failed to fetch predictions for station {station_id}: HTTP {status}'}
+        if reference_station_id:
+            return {'error': f'Error fetching predictions from reference station: {str(error)}'}
+        return {'error': f'Error fetching predictions: {str(error)}'}
+    
     def _get_noaa_tide_data(self, beach_name: str, target_date: str = None) -> Dict:
         """
         Get tide data from NOAA CO-OPS for the nearest tide station.
@@ -219,159 +766,154 @@ class StormglassDataFetcher:
         """
         try:
             # Get the tide station ID for this beach
-            station_id = self.tide_stations.get(beach_name.lower())
+            station_id = self.tide_stations.get(_canonical_beach_name(beach_name))
             if not station_id:
                 return {'error': f'No tide station found for {beach_name}'}
             
-            # Parse target date or use current date
-            if target_date:
-                if isinstance(target_date, str):
-                    date_obj = datetime.strptime(target_date, '%Y-%m-%d')
-                else:
-                    date_obj = target_date  # Already a datetime object
-            else:
-                date_obj = datetime.now()
+            date_str = self._tide_date_str(target_date)
             
-            # Ensure we have a datetime object for processing
-            if not isinstance(date_obj, datetime):
-                date_obj = datetime.strptime(str(date_obj), '%Y-%m-%d')
+            # Get station metadata to check if it's subordinate; subordinate stations
+            # use high/low predictions from their reference station
+            station_metadata = self._get_station_metadata(station_id)
+            reference_station_id = self._reference_station_id(station_metadata)
             
-            date_str = date_obj.strftime('%Y%m%d')
+            try:
+                predictions = self._fetch_predictions(reference_station_id or station_id, date_str)
+                return self._build_tide_data(station_id, station_metadata, predictions)
+            except requests.exceptions.HTTPError as e:
+                return self._predictions_error(station_id, reference_station_id, e, e.response.status_code)
+            except Exception as e:
+                return self._predictions_error(station_id, reference_station_id, e)
             
-            # Get station metadata to check if it's subordinate
-            station_metadata = self._get_station_metadata(station_id)
+        except Exception as e:
+            logger.debug('NOAA fetch failed', exc_info=True)
+            return {'error': f'Error fetching NOAA tide data: {str(e)}'}
+    
+    async def _aget_noaa_tide_data(self, beach_name: str, target_date: str = None) -> Dict:
+        """Async variant of _get_noaa_tide_data."""
+        try:
+            station_id = self.tide_stations.get(_canonical_beach_name(beach_name))
+            if not station_id:
+                return {'error': f'No tide station found for {beach_name}'}
             
-            # Check if this is a subordinate station
-            if station_metadata and station_metadata.get('type') == 'S' and station_metadata.get('reference_id'):
-                # This is a subordinate station - get predictions from reference station
-                reference_station_id = station_metadata['reference_id']
-                offsets = station_metadata.get('tidepredoffsets', {})
-                
-                # Extract offset values from the metadata
-                offsets_dict = offsets if isinstance(offsets, dict) else {}
-                time_high = offsets_dict.get('time_high', 0)
-                time_low = offsets_dict.get('time_low', 0)
-                height_high = offsets_dict.get('height_high', 1.0)
-                height_low = offsets_dict.get('height_low', 1.0)
-                
-                # Get high/low tide predictions from reference station using NOAA API directly
-                # The noaa_coops library may not support predictions product well, so use direct API
-                predictions_url = (
-                    f"https://api.tidesandcurrents.noaa.gov/api/prod/datagetter?"
-                    f"product=predictions&application=NOS.COOPS.TAC.WL&"
-                    f"station={reference_station_id}&begin_date={date_str}&end_date={date_str}&"
-                    f"datum=MLLW&interval=hilo&units=metric&time_zone=gmt&format=json"
-                )
-                
-                try:
-                    predictions_response = requests.get(predictions_url, timeout=10)
-                    if predictions_response.status_code == 200:
-                        predictions_data = predictions_response.json()
-                        predictions_list = predictions_data.get('predictions', [])
-                        
-                        if not predictions_list:
-                            return {'error': f'No tide predictions available from reference station {reference_station_id}'}
-                        
-                        # Apply offsets to high/low tides
-                        high_low_tides = []
-                        for pred in predictions_list:
-                            tide_type = pred.get('type', '').upper()  # 'H' for high, 'L' for low
-                            tide_time_str = pred.get('t', '')
-                            tide_value_m = float(pred.get('v', 0))
-                            tide_value_ft = tide_value_m * 3.28084  # Convert to feet
-                            
-                            # Parse time (format: YYYY-MM-DD HH:MM)
-                            try:
-                                tide_time = datetime.strptime(tide_time_str, '%Y-%m-%d %H:%M')
-                            except:
-                                # Try alternative format
-                                tide_time = datetime.strptime(tide_time_str, '%Y-%m-%d %H:%M:%S')
-                            
-                            # Apply height offset
-                            if tide_type == 'H':  # High tide
-                                tide_value_ft = tide_value_ft * height_high
-                                time_offset = time_high
-                            else:  # Low tide
-                                tide_value_ft = tide_value_ft * height_low
-                                time_offset = time_low
-                            
-                            # Apply time offset
-                            adjusted_time = tide_time + timedelta(minutes=time_offset)
-                            
-                            high_low_tides.append({
-                                'time': adjusted_time,
-                                'tide': tide_value_ft,
-                                'reference_station': reference_station_id
-                            })
-                        
-                        # Return only high/low tide points (no interpolation)
-                        tide_conditions = []
-                        for tide in high_low_tides:
-                            tide_conditions.append({
-                                'time': tide['time'].strftime('%Y-%m-%dT%H:%M:%S+00:00'),
-                                'tide': round(tide['tide'], 2)
-                            })
-                        
-                        return {
-                            'tide_conditions': tide_conditions,
-                            'station_id': station_id,
-                            'reference_station_id': reference_station_id,
-                            'station_name': f'Station {station_id} (subordinate, ref: {reference_station_id})'
-                        }
-                    else:
-                        return {'error': f'Failed to fetch predictions from reference station {reference_station_id}: HTTP {predictions_response.status_code}'}
-                except Exception as e:
-                    return {'error': f'Error fetching predictions from reference station: {str(e)}'}
-            else:
-                # This is a harmonic station - get high/low predictions (not hourly water level)
-                # Use predictions API to get high/low points for consistency
-                predictions_url = (
-                    f"https://api.tidesandcurrents.noaa.gov/api/prod/datagetter?"
-                    f"product=predictions&application=NOS.COOPS.TAC.WL&"
-                    f"station={station_id}&begin_date={date_str}&end_date={date_str}&"
-                    f"datum=MLLW&interval=hilo&units=metric&time_zone=gmt&format=json"
-                )
-                
-                try:
-                    predictions_response = requests.get(predictions_url, timeout=10)
-                    if predictions_response.status_code == 200:
-                        predictions_data = predictions_response.json()
-                        predictions_list = predictions_data.get('predictions', [])
-                        
-                        if not predictions_list:
-                            return {'error': f'No tide predictions available for station {station_id}'}
-                        
-                        # Convert to our format
-                        tide_conditions = []
-                        for pred in predictions_list:
-                            tide_time_str = pred.get('t', '')
-                            tide_value_m = float(pred.get('v', 0))
-                            tide_value_ft = tide_value_m * 3.28084  # Convert to feet
-                            
-                            # Parse time
-                            try:
-                                tide_time = datetime.strptime(tide_time_str, '%Y-%m-%d %H:%M')
-                            except:
-                                tide_time = datetime.strptime(tide_time_str, '%Y-%m-%d %H:%M:%S')
-                            
-                            tide_conditions.append({
-                                'time': tide_time.strftime('%Y-%m-%dT%H:%M:%S+00:00'),
-                                'tide': round(tide_value_ft, 2)
-                            })
-                        
-                        return {
-                            'tide_conditions': tide_conditions,
-                            'station_id': station_id,
-                            'station_name': f'Station {station_id}'
-                        }
-                    else:
-                        return {'error': f'Failed to fetch predictions for station {station_id}: HTTP {predictions_response.status_code}'}
-                except Exception as e:
-                    return {'error': f'Error fetching predictions: {str(e)}'}
+            date_str = self._tide_date_str(target_date)
+            
+            station_metadata = await self._aget_station_metadata(station_id)
+            reference_station_id = self._reference_station_id(station_metadata)
+            
+            try:
+                predictions = await self._afetch_predictions(reference_station_id or station_id, date_str)
+                return self._build_tide_data(station_id, station_metadata, predictions)
+            except aiohttp.ClientResponseError as e:
+                return self._predictions_error(station_id, reference_station_id, e, e.status)
+            except Exception as e:
+                return self._predictions_error(station_id, reference_station_id, e)
             
         except Exception as e:
-            import traceback
-            return {'error': f'Error fetching NOAA tide data: {str(e)}\n{traceback.format_exc()}'}
+            logger.debug('NOAA fetch failed', exc_info=True)
+            return {'error': f'Error fetching NOAA tide data: {str(e)}'}
+    
+    def _weather_params(self, lat: float, lng: float, target_date=None) -> Dict:
+        """Build the Stormglass weather/point query parameters for the target day (or today)."""
+        # Day boundaries for the target day (or today)
+        if not target_date:
+            # Current UTC day; plain integer math avoids a local timezone lookup
+            now = int(time.time())
+            start_ts = now - (now % 86400)
+            end_ts = start_ts + 86399
+        else:
+            day = datetime.strptime(target_date, '%Y-%m-%d') if isinstance(target_date, str) else target_date
+            start_ts = int(day.replace(hour=0, minute=0, second=0, microsecond=0).timestamp())
+            end_ts = int(day.replace(hour=23, minute=59, second=59).timestamp())
+        
+        return {
+            'lat': lat,
+            'lng': lng,
+            'params': self._WEATHER_PARAMS,
+            'source': 'noaa',  # Use NOAA as primary source
+            'start': start_ts,  # Start of target day
+            'end': end_ts  # End of target day
+        }
+    
+    @staticmethod
+    def _cache_key(lat: float, lng: float, target_date=None) -> str:
+        """Create the surf data cache key for a location and date."""
+        date_suffix = f"_{target_date}" if target_date else ""
+        return f"{lat},{lng}{date_suffix}"
+    
+    @staticmethod
+    def _beach_not_found(beach_name: str) -> Dict:
+        """Build the error result for a beach without known coordinates."""
+        return {
+            'error': f'Beach "{beach_name}" not found in database. Please provide coordinates.',
+            'beach_name': beach_name
+        }
+    
+    @staticmethod
+    def _fetch_error(beach_name: str, lat: float, lng: float, message: str) -> Dict:
+        """Build the error result for a failed surf data fetch."""
+        return {
+            'error': message,
+            'beach_name': beach_name,
+            'coordinates': {'lat': lat, 'lng': lng}
+        }
+    
+    def _cached_result(self, beach_name: str, lat: float, lng: float, cache_key: str) -> Optional[Dict]:
+        """Return the surf data result for an unexpired cache entry, or None on a miss."""
+        cached_data = self._load_cache(cache_key)
+        if cached_data is None:
+            return None
+        return {
+            'beach_name': beach_name,
+            'coordinates': {'lat': lat, 'lng': lng},
+            'data': cached_data['data'],
+            'tide_data': cached_data['tide_data'],
+            'cached': True,
+            'timestamp': cached_data['timestamp']
+        }
+    
+    def _weather_result(self, beach_name: str, lat: float, lng: float, cache_key: str, current_time: float,
+                        status: int, body: bytes, get_tide_data: Callable[[], Dict]) -> Dict:
+        """
+        Build the surf data result for a Stormglass response, caching it on success.
+        
+        Args:
+            beach_name: Name of the surf beach
+            lat: Latitude
+            lng: Longitude
+            cache_key: Cache key for the location and date
+            current_time: Time the fetch started, stored as the cache timestamp
+            status: HTTP status of the weather/point response
+            body: Raw weather/point response body
+            get_tide_data: Returns the NOAA tide data; only called for successful responses
+            
+        Returns:
+            Dictionary containing surf data or error information
+        """
+        if status != 200:
+            return self._fetch_error(
+                beach_name, lat, lng,
+                f'API request failed with status {status}: {body.decode("utf-8", errors="replace")}'
+            )
+        
+        data = _json_loads(body)
+        tide_data = get_tide_data()
+        
+        # Cache the data
+        self._save_cache(cache_key, {
+            'data': data,
+            'tide_data': tide_data,
+            'timestamp': current_time
+        })
+        
+        return {
+            'beach_name': beach_name,
+            'coordinates': {'lat': lat, 'lng': lng},
+            'data': data,
+            'tide_data': tide_data,
+            'cached': False,
+            'timestamp': current_time
+        }
     
     def fetch_surf_data(self, beach_name: str, lat: Optional[float] = None, lng: Optional[float] = None, target_date: str = None) -> Dict:
         """
@@ -390,105 +932,170 @@ class StormglassDataFetcher:
         if lat is None or lng is None:
             coords = self._get_beach_coordinates(beach_name)
             if coords is None:
-                return {
-                    'error': f'Beach "{beach_name}" not found in database. Please provide coordinates.',
-                    'beach_name': beach_name
-                }
+                return self._beach_not_found(beach_name)
             lat, lng = coords
         
+        return self._fetch_point(beach_name, lat, lng, target_date)
+    
+    def _fetch_point(self, beach_name: str, lat: float, lng: float, target_date: str = None,
+                     submit_tide: Optional[Callable[[str, Optional[str]], Future]] = None) -> Dict:
+        """
+        Fetch surf data for resolved coordinates, using the cache when possible.
+        
+        Args:
+            beach_name: Name of the surf beach
+            lat: Latitude
+            lng: Longitude
+            target_date: Target date in YYYY-MM-DD format (optional, defaults to current day)
+            submit_tide: Callable that starts the NOAA tide lookup and returns its future.
+                Defaults to submitting _get_noaa_tide_data to the fetcher's executor.
+            
+        Returns:
+            Dictionary containing surf data or error information
+        """
         # Check cache first
-        cache = self._load_cache()
-        # Create cache key with date
-        date_suffix = f"_{target_date}" if target_date else ""
-        cache_key = f"{lat},{lng}{date_suffix}"
+        cache_key = self._cache_key(lat, lng, target_date)
         current_time = time.time()
         
-        if cache_key in cache:
-            cached_data = cache[cache_key]
-            if (current_time - cached_data['timestamp']) < self.cache_expiry:
-                return {
-                    'beach_name': beach_name,
-                    'coordinates': {'lat': lat, 'lng': lng},
-                    'data': cached_data['data'],
-                    'tide_data': cached_data.get('tide_data', {}),
-                    'cached': True,
-                    'timestamp': cached_data['timestamp']
-                }
+        cached_result = self._cached_result(beach_name, lat, lng, cache_key)
+        if cached_result is not None:
+            return cached_result
         
         # Make API call
         try:
             # Single API call with all parameters for the entire day
             url = f"{self.base_url}/weather/point"
-            params = {
-                'lat': lat,
-                'lng': lng,
-                'params': ','.join([
-                    'waveHeight',      # Wave height
-                    'waveDirection',   # Wave direction
-                    'wavePeriod',      # Wave period
-                    'windSpeed',       # Wind speed
-                    'windDirection',   # Wind direction
-                    'waterTemperature', # Water temperature
-                    'airTemperature',  # Air temperature
-                    'pressure',        # Atmospheric pressure
-                    'humidity',        # Humidity
-                    'visibility',      # Visibility
-                    'cloudCover',     # Cloud cover
-                    'precipitation'   # Precipitation
-                ]),
-                'source': 'noaa',  # Use NOAA as primary source
-                'start': int((datetime.strptime(target_date, '%Y-%m-%d') if isinstance(target_date, str) else target_date).replace(hour=0, minute=0, second=0).timestamp()) if target_date else int(datetime.now().replace(hour=0, minute=0, second=0).timestamp()),  # Start of target day
-                'end': int((datetime.strptime(target_date, '%Y-%m-%d') if isinstance(target_date, str) else target_date).replace(hour=23, minute=59, second=59).timestamp()) if target_date else int(datetime.now().replace(hour=23, minute=59, second=59).timestamp())  # End of target day
-            }
+            params = self._weather_params(lat, lng, target_date)
             
-            headers = {
-                'Authorization': self.api_key
-            }
-            
-            response = requests.get(url, params=params, headers=headers, timeout=30)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Get NOAA tide data
-                tide_data = self._get_noaa_tide_data(beach_name, target_date)
-                
-                # Cache the data
-                cache_data = {
-                    'data': data,
-                    'tide_data': tide_data,
-                    'timestamp': current_time
-                }
-                cache[cache_key] = cache_data
-                self._save_cache(cache)
-                
-                return {
-                    'beach_name': beach_name,
-                    'coordinates': {'lat': lat, 'lng': lng},
-                    'data': data,
-                    'tide_data': tide_data,
-                    'cached': False,
-                    'timestamp': current_time
-                }
+            # Start the NOAA tide lookup in the background while the weather request runs here
+            if submit_tide is None:
+                tide_future = self._executor.submit(self._get_noaa_tide_data, beach_name, target_date)
             else:
-                return {
-                    'error': f'API request failed with status {response.status_code}: {response.text}',
-                    'beach_name': beach_name,
-                    'coordinates': {'lat': lat, 'lng': lng}
-                }
+                tide_future = submit_tide(beach_name, target_date)
+            response = self._session.get(url, params=params, headers=self._headers, timeout=_WEATHER_TIMEOUT)
+            
+            return self._weather_result(
+                beach_name, lat, lng, cache_key, current_time,
+                response.status_code, response.content, tide_future.result
+            )
                 
         except requests.exceptions.RequestException as e:
-            return {
-                'error': f'Network error: {str(e)}',
-                'beach_name': beach_name,
-                'coordinates': {'lat': lat, 'lng': lng}
-            }
+            return self._fetch_error(beach_name, lat, lng, f'Network error: {str(e)}')
         except Exception as e:
-            return {
-                'error': f'Unexpected error: {str(e)}',
-                'beach_name': beach_name,
-                'coordinates': {'lat': lat, 'lng': lng}
+            return self._fetch_error(beach_name, lat, lng, f'Unexpected error: {str(e)}')
+    
+    def fetch_surf_data_batch(self, beaches: List[Tuple[str, Optional[str]]], max_workers: int = 16) -> Dict[Tuple[str, Optional[str]], Dict]:
+        """
+        Fetch surf data for several beaches at once.
+        Beaches that share coordinates and date share one Stormglass request, and
+        beaches that share a tide station and date share one NOAA lookup.
+        
+        Args:
+            beaches: List of (beach_name, target_date) pairs; target_date may be None
+            max_workers: Maximum number of concurrent requests of each kind
+            
+        Returns:
+            Dictionary mapping each (beach_name, target_date) pair to its fetch_surf_data result
+        """
+        results = {}
+        
+        # Group requests by location and date so each is fetched once
+        groups: Dict[Tuple[float, float, Optional[str]], List[Tuple[str, Optional[str]]]] = {}
+        for beach_name, target_date in beaches:
+            coords = self._get_beach_coordinates(beach_name)
+            if coords is None:
+                results[(beach_name, target_date)] = self._beach_not_found(beach_name)
+                continue
+            groups.setdefault((coords[0], coords[1], target_date), []).append((beach_name, target_date))
+        
+        # Weather requests and tide lookups use separate pools: weather tasks wait on
+        # tide futures, so sharing one bounded pool could deadlock
+        with ThreadPoolExecutor(max_workers=max_workers) as weather_pool, \
+                ThreadPoolExecutor(max_workers=max_workers) as tide_pool:
+            tide_futures: Dict[Tuple[str, Optional[str]], Future] = {}
+            tide_lock = threading.Lock()
+            
+            def submit_tide(beach_name: str, target_date: Optional[str]) -> Future:
+                station_key = self.tide_stations.get(_canonical_beach_name(beach_name)) or _canonical_beach_name(beach_name)
+                with tide_lock:
+                    if (station_key, target_date) not in tide_futures:
+                        tide_futures[(station_key, target_date)] = tide_pool.submit(self._get_noaa_tide_data, beach_name, target_date)
+                    return tide_futures[(station_key, target_date)]
+            
+            group_futures = {
+                key: weather_pool.submit(self._fetch_point, members[0][0], key[0], key[1], key[2], submit_tide)
+                for key, members in groups.items()
             }
+            
+            # Stitch the shared results back onto each requested beach
+            for key, members in groups.items():
+                group_result = group_futures[key].result()
+                for beach_name, target_date in members:
+                    results[(beach_name, target_date)] = {**group_result, 'beach_name': beach_name}
+        
+        return results
+    
+    async def _aget_weather(self, params: Dict) -> Tuple[int, bytes]:
+        """Fetch the Stormglass weather/point response, returning (status, body)."""
+        session = await self._get_async_session()
+        url = f"{self.base_url}/weather/point"
+        async with session.get(url, params=params, headers=self._headers, timeout=aiohttp.ClientTimeout(total=_WEATHER_TIMEOUT[1], connect=_CONNECT_TIMEOUT)) as response:
+            return response.status, await response.read()
+    
+    async def afetch_surf_data(self, beach_name: str, lat: Optional[float] = None, lng: Optional[float] = None, target_date: str = None) -> Dict:
+        """
+        Async variant of fetch_surf_data using a shared aiohttp session.
+        Lets callers fan out across many beaches concurrently, e.g. with asyncio.gather.
+        Call aclose() when done.
+        
+        Args:
+            beach_name: Name of the surf beach
+            lat: Latitude (optional, will lookup if not provided)
+            lng: Longitude (optional, will lookup if not provided)
+            target_date: Target date in YYYY-MM-DD format (optional, defaults to current day)
+            
+        Returns:
+            Dictionary containing surf data or error information
+            
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        # Fail fast if aiohttp is unavailable
+        await self._get_async_session()
+        
+        # Get coordinates
+        if lat is None or lng is None:
+            coords = self._get_beach_coordinates(beach_name)
+            if coords is None:
+                return self._beach_not_found(beach_name)
+            lat, lng = coords
+        
+        # Check cache first
+        cache_key = self._cache_key(lat, lng, target_date)
+        current_time = time.time()
+        
+        cached_result = self._cached_result(beach_name, lat, lng, cache_key)
+        if cached_result is not None:
+            return cached_result
+        
+        try:
+            params = self._weather_params(lat, lng, target_date)
+            
+            # Fetch weather and NOAA tide data concurrently
+            (status, body), tide_data = await asyncio.gather(
+                self._aget_weather(params),
+                self._aget_noaa_tide_data(beach_name, target_date)
+            )
+            
+            return self._weather_result(
+                beach_name, lat, lng, cache_key, current_time,
+                status, body, lambda: tide_data
+            )
+                
+        except _ASYNC_NETWORK_ERRORS as e:
+            return self._fetch_error(beach_name, lat, lng, f'Network error: {str(e)}')
+        except Exception as e:
+            return self._fetch_error(beach_name, lat, lng, f'Unexpected error: {str(e)}')
     
     def get_hourly_conditions(self, beach_name: str, lat: Optional[float] = None, lng: Optional[float] = None, target_date: str = None) -> Dict:
         """
@@ -511,38 +1118,34 @@ class StormglassDataFetcher:
             data = result['data']
             hours = data.get('hours', [])
             
+            # Convert units from metric to imperial for all hours at once
+            wave_heights_ft = _rounded_with_na(_metric_array(hours, 'waveHeight') * 3.28084)
+            wind_speeds_mph = _rounded_with_na(_metric_array(hours, 'windSpeed') * 2.23694)
+            water_temps_f = _rounded_with_na(_metric_array(hours, 'waterTemperature') * 9/5 + 32)
+            air_temps_f = _rounded_with_na(_metric_array(hours, 'airTemperature') * 9/5 + 32)
+            visibilities_mi = _rounded_with_na(_metric_array(hours, 'visibility') * 0.621371)
+            
             hourly_conditions = []
-            for hour_data in hours:
-                # Convert units from metric to imperial
-                wave_height_m = hour_data.get('waveHeight', {}).get('noaa', 'N/A')
-                wave_height_ft = round(float(wave_height_m) * 3.28084, 1) if wave_height_m != 'N/A' else 'N/A'
-                
-                wind_speed_ms = hour_data.get('windSpeed', {}).get('noaa', 'N/A')
-                wind_speed_mph = round(float(wind_speed_ms) * 2.23694, 1) if wind_speed_ms != 'N/A' else 'N/A'
-                
-                water_temp_c = hour_data.get('waterTemperature', {}).get('noaa', 'N/A')
-                water_temp_f = round(float(water_temp_c) * 9/5 + 32, 1) if water_temp_c != 'N/A' else 'N/A'
-                
-                air_temp_c = hour_data.get('airTemperature', {}).get('noaa', 'N/A')
-                air_temp_f = round(float(air_temp_c) * 9/5 + 32, 1) if air_temp_c != 'N/A' else 'N/A'
-                
-                visibility_km = hour_data.get('visibility', {}).get('noaa', 'N/A')
-                visibility_mi = round(float(visibility_km) * 0.621371, 1) if visibility_km != 'N/A' else 'N/A'
-                
+            for hour_data, wave_height, wind_speed, water_temp, air_temp, visibility in zip(
+                hours, wave_heights_ft, wind_speeds_mph, water_temps_f, air_temps_f, visibilities_mi
+            ):
+                wave_direction, wave_period, wind_direction, pressure, humidity, cloud_cover, precipitation = (
+                    _noaa(hour_data, field) for field in _PASSTHROUGH_FIELDS
+                )
                 hourly_conditions.append({
                     'time': hour_data.get('time', 'N/A'),
-                    'wave_height': wave_height_ft,
-                    'wave_direction': hour_data.get('waveDirection', {}).get('noaa', 'N/A'),
-                    'wave_period': hour_data.get('wavePeriod', {}).get('noaa', 'N/A'),
-                    'wind_speed': wind_speed_mph,
-                    'wind_direction': hour_data.get('windDirection', {}).get('noaa', 'N/A'),
-                    'water_temperature': water_temp_f,
-                    'air_temperature': air_temp_f,
-                    'pressure': hour_data.get('pressure', {}).get('noaa', 'N/A'),
-                    'humidity': hour_data.get('humidity', {}).get('noaa', 'N/A'),
-                    'visibility': visibility_mi,
-                    'cloud_cover': hour_data.get('cloudCover', {}).get('noaa', 'N/A'),
-                    'precipitation': hour_data.get('precipitation', {}).get('noaa', 'N/A')
+                    'wave_height': wave_height,
+                    'wave_direction': wave_direction,
+                    'wave_period': wave_period,
+                    'wind_speed': wind_speed,
+                    'wind_direction': wind_direction,
+                    'water_temperature': water_temp,
+                    'air_temperature': air_temp,
+                    'pressure': pressure,
+                    'humidity': humidity,
+                    'visibility': visibility,
+                    'cloud_cover': cloud_cover,
+                    'precipitation': precipitation
                 })
             
             return {
@@ -553,7 +1156,7 @@ class StormglassDataFetcher:
                 'hourly_conditions': hourly_conditions,
                 'total_hours': len(hourly_conditions)
             }
-        except (KeyError, IndexError, TypeError) as e:
+        except (KeyError, IndexError, TypeError, ValueError) as e:
             return {
                 'error': f'Error parsing API response: {str(e)}',
                 'beach_name': result['beach_name'],
@@ -636,9 +1239,53 @@ class StormglassDataFetcher:
         Returns:
             Dictionary with current conditions
         """
-        current_hour_index = datetime.now().hour
+        current_hour_index = self._current_hour_index(target_date)
         result = self.fetch_surf_data(beach_name, lat, lng, target_date)
+        return self._current_conditions_from_result(result, current_hour_index)
+    
+    def get_current_conditions_batch(self, beaches: List[Tuple[str, Optional[str]]], max_workers: int = 8) -> List[Dict]:
+        """
+        Get current surf conditions for several beaches at once.
+        The surf data is fetched concurrently with fetch_surf_data_batch, and the
+        current hour is looked up once for the whole batch.
         
+        Args:
+            beaches: List of (beach_name, target_date) pairs; target_date may be None
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            List of get_current_conditions results, in the same order as beaches
+        """
+        local_hour_index = datetime.now().hour
+        utc_hour_index = self._current_hour_index(None)
+        results = self.fetch_surf_data_batch(beaches, max_workers)
+        return [
+            self._current_conditions_from_result(
+                results[(beach_name, target_date)],
+                local_hour_index if target_date else utc_hour_index
+            )
+            for beach_name, target_date in beaches
+        ]
+    
+    @staticmethod
+    def _current_hour_index(target_date: Optional[str]) -> int:
+        """Return the index of the current hour in the fetched hours for target_date."""
+        if target_date:
+            return datetime.now().hour
+        # Today's hours start at UTC midnight (see _weather_params)
+        return int(time.time()) % 86400 // 3600
+    
+    def _current_conditions_from_result(self, result: Dict, current_hour_index: int) -> Dict:
+        """
+        Build the simplified current conditions from a fetch_surf_data result.
+        
+        Args:
+            result: Result of fetch_surf_data
+            current_hour_index: Index of the current hour in the fetched hours
+            
+        Returns:
+            Dictionary with current conditions
+        """
         if 'error' in result:
             return result
         
@@ -649,20 +1296,22 @@ class StormglassDataFetcher:
             except IndexError:
                 current_hour = data['hours'][0] # Default to first hour (00:00) if index is out of range
 
+            values = {key: _noaa(current_hour, key) for key in _NOAA_KEYS}
+            
             # Convert units from metric to imperial
-            wave_height_m = current_hour.get('waveHeight', {}).get('noaa', 'N/A')
+            wave_height_m = values['waveHeight']
             wave_height_ft = round(float(wave_height_m) * 3.28084, 1) if wave_height_m != 'N/A' else 'N/A'
             
-            wind_speed_ms = current_hour.get('windSpeed', {}).get('noaa', 'N/A')
+            wind_speed_ms = values['windSpeed']
             wind_speed_mph = round(float(wind_speed_ms) * 2.23694, 1) if wind_speed_ms != 'N/A' else 'N/A'
             
-            water_temp_c = current_hour.get('waterTemperature', {}).get('noaa', 'N/A')
+            water_temp_c = values['waterTemperature']
             water_temp_f = round(float(water_temp_c) * 9/5 + 32, 1) if water_temp_c != 'N/A' else 'N/A'
             
-            air_temp_c = current_hour.get('airTemperature', {}).get('noaa', 'N/A')
+            air_temp_c = values['airTemperature']
             air_temp_f = round(float(air_temp_c) * 9/5 + 32, 1) if air_temp_c != 'N/A' else 'N/A'
             
-            visibility_km = current_hour.get('visibility', {}).get('noaa', 'N/A')
+            visibility_km = values['visibility']
             visibility_mi = round(float(visibility_km) * 0.621371, 1) if visibility_km != 'N/A' else 'N/A'
             
             return {
@@ -672,17 +1321,17 @@ class StormglassDataFetcher:
                 'timestamp': result.get('timestamp'),
                 'current_conditions': {
                     'wave_height': wave_height_ft,
-                    'wave_direction': current_hour.get('waveDirection', {}).get('noaa', 'N/A'),
-                    'wave_period': current_hour.get('wavePeriod', {}).get('noaa', 'N/A'),
+                    'wave_direction': values['waveDirection'],
+                    'wave_period': values['wavePeriod'],
                     'wind_speed': wind_speed_mph,
-                    'wind_direction': current_hour.get('windDirection', {}).get('noaa', 'N/A'),
+                    'wind_direction': values['windDirection'],
                     'water_temperature': water_temp_f,
                     'air_temperature': air_temp_f,
-                    'pressure': current_hour.get('pressure', {}).get('noaa', 'N/A'),
-                    'humidity': current_hour.get('humidity', {}).get('noaa', 'N/A'),
+                    'pressure': values['pressure'],
+                    'humidity': values['humidity'],
                     'visibility': visibility_mi,
-                    'cloud_cover': current_hour.get('cloudCover', {}).get('noaa', 'N/A'),
-                    'precipitation': current_hour.get('precipitation', {}).get('noaa', 'N/A')
+                    'cloud_cover': values['cloudCover'],
+                    'precipitation': values['precipitation']
                 }
             }
         except (KeyError, IndexError, TypeError) as e:
@@ -0,0 +1,189 @@
+"""
+Parser for the "Best Time to Surf" section of Gemini surf analyses.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# Time range such as "8:00 AM - 9:00 AM" at the start of a line
+_TIME_RE = re.compile(r'[0-9]{1,2}[:.]?[0-9]{0,2}\s*(?:AM|PM|am|pm)?(?:\s*[-–—]\s*[0-9]{1,2}[:.]?[0-9]{0,2}\s*(?:AM|PM|am|pm))?', re.IGNORECASE)
+# Number or numeric range such as "5.6-5.7" or "14"
+_NUMBER_RANGE_RE = re.compile(r'(\d+\.?\d*)(?:\s*[-–—]\s*\d+\.?\d*)?')
+# Deletes markdown emphasis markers
+_STAR_DEL = str.maketrans('', '', '*')
+_WS_RE = re.compile(r'[ \t]+')
+_NL_RE = re.compile(r'\n[ \t]*\n+')
+
+# Lines that end the "Best Time to Surf" section
+_SECTION_END_PREFIXES = ('specific recommendations', 'notable changes')
+
+# Field labels in the "Best Time to Surf" section; the named group is the field, alternatives most specific first
+_FIELD_RE = re.compile(
+    r'(?P<rating>rating|score)'
+    r'|(?P<period>wave period|period)'
+    r'|(?P<wave>wave height|wave size|wave)'
+    r'|(?P<wind>wind speed|wind)'
+    r'|(?P<explanation>explanation|reason)',
+    re.IGNORECASE
+)
+# Rating given inline on the heading or time line, e.g. "7 AM - 8 AM (Rating: 85)"
+_INLINE_RATING_RE = re.compile(r'\b(?:rating|score|rated)\b[\s:]*(\d{1,3})', re.IGNORECASE)
+
+
+def _is_numbered_heading(line: str) -> bool:
+    """Return True if a stripped line starts like "3." (but not like "8.00")."""
+    i = 0
+    while i < len(line) and line[i].isdigit():
+        i += 1
+    return 0 < i and line[i:i + 1] == '.' and not line[i + 1:i + 2].isdigit()
+
+
+def _number_with_unit(text: str, unit: str) -> Optional[str]:
+    """Return the first number or range in text followed by unit, e.g. "5.6-5.7ft"."""
+    match = _NUMBER_RANGE_RE.search(text)
+    if match and text[match.end():].lstrip().lower().startswith(unit):
+        return match.group(0) + unit
+    return None
+
+
+def _clean_explanation(text: str) -> Optional[str]:
+    """Strip markdown from explanation text, keeping paragraph breaks."""
+    text = text.translate(_STAR_DEL)
+    text = _WS_RE.sub(' ', text)
+    text = _NL_RE.sub('\n\n', text)
+    text = text.strip().rstrip(':').strip()
+    return text or None
+
+
+def _parse_best_time_entry(lines: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Parse the lines of a "Best Time to Surf" section in a single pass.
+    
+    Args:
+        lines: Section lines; the first is the text following the heading
+        
+    Returns:
+        Dictionary with the best time data, or None if no time was found
+    """
+    entry: Dict[str, Any] = {
+        'time': None,
+        'rating': None,
+        'wave_height_range': None,
+        'period': None,
+        'wind_speed_range': None,
+        'reason': None
+    }
+    explanation: Optional[List[str]] = None
+    
+    for line in lines:
+        if explanation is not None:
+            # Everything after "Explanation:" belongs to the explanation
+            explanation.append(line)
+            continue
+        
+        text = line.lstrip(' *\t-•')
+        field_match = _FIELD_RE.match(text)
+        if field_match is None:
+            # Not a field line; the first one starting with a time holds the time range
+            if entry['time'] is None and text[:1].isdigit():
+                time_match = _TIME_RE.match(text)
+                if time_match:
+                    entry['time'] = time_match.group(0).strip()
+                    rating_match = _INLINE_RATING_RE.search(text, time_match.end())
+                    if rating_match:
+                        entry['rating'] = int(rating_match.group(1))
+            continue
+        
+        field = field_match.lastgroup
+        value = text[field_match.end():].lstrip(' *:\t')
+        if field == 'rating':
+            match = _NUMBER_RANGE_RE.search(value)
+            if match and entry['rating'] is None:
+                entry['rating'] = int(float(match.group(1)))
+        elif field == 'period':
+            match = _NUMBER_RANGE_RE.search(value)
+            if match and entry['period'] is None:
+                entry['period'] = round(float(match.group(1)))
+        elif field == 'wave':
+            entry['wave_height_range'] = entry['wave_height_range'] or _number_with_unit(value, 'ft')
+        elif field == 'wind':
+            entry['wind_speed_range'] = entry['wind_speed_range'] or _number_with_unit(value, 'mph')
+        else:
+            explanation = [value]
+    
+    if not entry['time']:
+        return None
+    if explanation is not None:
+        entry['reason'] = _clean_explanation('\n'.join(explanation))
+    return entry
+
+
+def _find_best_time_section(lines: List[str]) -> Optional[Tuple[int, str]]:
+    """
+    Find the "Best Time to Surf:" heading.
+    
+    Args:
+        lines: Lines of the analysis text
+        
+    Returns:
+        Tuple of (heading line index, text following the heading), or None if not found
+    """
+    for index, line in enumerate(lines):
+        unstarred = line.replace('*', '')
+        heading = unstarred.lower()
+        idx = heading.find('best time to surf')
+        if idx == -1:
+            idx = heading.find('best times to surf')
+        if idx == -1:
+            continue
+        # The time may follow the heading on the same line
+        rest = unstarred[heading.index('surf', idx) + 4:]
+        if not rest.strip() or rest.lstrip().startswith(':'):
+            return index, rest
+    return None
+
+
+def parse_best_times(ai_analysis_text: str) -> List[Dict[str, Any]]:
+    """
+    Parse the best surf time from AI analysis text.
+    Results are memoized per text, since the same analysis is often parsed
+    repeatedly (e.g. on every cached API response).
+    
+    Args:
+        ai_analysis_text: The full AI analysis text containing best times section
+        
+    Returns:
+        List with the single best time entry, or an empty list if none was found
+    """
+    # Copy the cached entries so callers can't modify them
+    return [dict(entry) for entry in _parse_best_times_cached(ai_analysis_text)]
+
+
+@lru_cache(maxsize=16)
+def _parse_best_times_cached(ai_analysis_text: str) -> Tuple[Dict[str, Any], ...]:
+    """
+    Parse the best surf time from AI analysis text (memoized).
+    
+    Args:
+        ai_analysis_text: The full AI analysis text containing best times section
+        
+    Returns:
+        Tuple with the single best time entry, or an empty tuple if none was found
+    """
+    lines = ai_analysis_text.split('\n')
+    found = _find_best_time_section(lines)
+    if found is None:
+        return ()
+    start, rest = found
+    
+    # The section runs until the next numbered heading or recommendations/changes section
+    section = [rest.lstrip(': \t')]
+    for line in lines[start + 1:]:
+        stripped = line.strip().lstrip('*').lstrip().lower()
+        if _is_numbered_heading(stripped) or stripped.startswith(_SECTION_END_PREFIXES):
+            break
+        section.append(line)
+    
+    entry = _parse_best_time_entry(section)
+    return (entry,) if entry else ()
@@ -2,12 +2,19 @@
 Prompt templates for the WaveWatch application.
 """
 
+import string
+from typing import Callable
+
+# Key legend for the compact JSON surf data produced by SurfSummarizer._format_surf_data
+SURF_DATA_LEGEND = """Surf data is compact JSON: "current" holds the current conditions. "hourly" covers the next 6 hours as a flat columnar array: the first number is the column count, then the column names, then the values row by row (one row per hour). Keys: t = time (UTC), wh_ft = wave height (ft), wp_s = wave period (s), wd_deg = wave direction (°), ws_mph = wind speed (mph), wdir_deg = wind direction (°), water_f / air_f = water / air temperature (°F), p_mb = pressure (mb), hum_pct = humidity (%), vis_mi = visibility (mi), cloud_pct = cloud cover (%). null means not available."""
+
 SURF_CONDITIONS_PROMPT = """Act as an expert surf forecaster for {surf_beach}.
 
 1. **Break-Specific Requirements:**
 {break_specific_conditions}
 
 2. **Current NOAA Data** (for {selected_date}):
+""" + SURF_DATA_LEGEND + """
 {surf_data}
 
 Task:
@@ -29,6 +36,7 @@ Keep it concise and actionable. Skip basic metrics since they're already display
 
 ONE_SENTENCE_SUMMARY_PROMPT = """Based on these surf conditions, provide a single sentence assessment of the surf quality at {beach_name} on {selected_date}. 
 
+""" + SURF_DATA_LEGEND + """
 {formatted_conditions}
 
 Format your response as: "[Quality] surf conditions on {selected_date} at {beach_name} because of [main factor]"
@@ -68,3 +76,39 @@ Format your response as follows:
 - [Any unique local factors, e.g., "Foggy in mornings", "Best on incoming tide", "Works best on south swell only", "Currents can be strong"]
 
 If specific information is not found in the search results, indicate "Not specified" for that section. Be concise and focus on the most frequently mentioned and reliable information."""
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Compile a str.format-style template into a keyword-only render function.
+    The generated function is a single f-string, so rendering skips the
+    placeholder parsing that str.format repeats on every call.
+    
+    Args:
+        template: Template text with plain {name} placeholders
+        
+    Returns:
+        Function taking each placeholder as a keyword argument and returning the prompt
+    """
+    namespace = {}
+    body = []
+    fields = []
+    for i, (literal, field, spec, conversion) in enumerate(string.Formatter().parse(template)):
+        # Literal chunks are bound as globals of the generated function, so their text needs no escaping
+        namespace[f'_chunk{i}'] = literal
+        body.append(f'{{_chunk{i}}}')
+        if field is not None:
+            if not field.isidentifier() or spec or conversion:
+                raise ValueError(f'Unsupported placeholder in prompt template: {{{field}}}')
+            body.append(f'{{{field}}}')
+            if field not in fields:
+                fields.append(field)
+    
+    exec(f"def render(*, {', '.join(fields)}):\n    return f'{''.join(body)}'\n", namespace)
+    return namespace['render']
+
+
+# Precompiled renderers, equivalent to calling .format(...) on the templates above
+render_surf_conditions_prompt = _compile_template(SURF_CONDITIONS_PROMPT)
+render_one_sentence_summary_prompt = _compile_template(ONE_SENTENCE_SUMMARY_PROMPT)
+render_break_specific_conditions_extraction_prompt = _compile_template(BREAK_SPECIFIC_CONDITIONS_EXTRACTION_PROMPT)
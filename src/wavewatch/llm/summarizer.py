@@ -4,10 +4,105 @@ LLM summarizer using Google Gemini for surf condition analysis.
 
 from google import genai
 import os
-import re
-from typing import Optional, List, Dict
-from .prompt_templates import SURF_CONDITIONS_PROMPT, ONE_SENTENCE_SUMMARY_PROMPT, BREAK_SPECIFIC_CONDITIONS_EXTRACTION_PROMPT
+import json
+import logging
+import math
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from operator import attrgetter
+from typing import Dict, Iterator, List, Optional
+from ._parse import parse_best_times
+from .prompt_templates import (
+    render_surf_conditions_prompt,
+    render_one_sentence_summary_prompt,
+    render_break_specific_conditions_extraction_prompt
+)
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Gemini model used for all summarizer requests
+_GEMINI_MODEL = 'gemini-2.0-flash-001'
+
+# Layout of one web search result in the break-specific extraction prompt
+_SEARCH_RESULT_FMT = "Result {}:\nTitle: {}\nURL: {}\nContent: {}\n".format
+
+# Metric to imperial unit conversion constants
+_M_TO_FT = 3.28084
+_MS_TO_MPH = 2.23694
+_KM_TO_MI = 0.621371
+_C_TO_F_FACTOR = 1.8
+_C_TO_F_OFFSET = 32.0
+
+# Hourly prompt data columns, in row order
+_HOURLY_COLUMNS = ('t', 'wh_ft', 'wp_s', 'ws_mph', 'wdir_deg', 'water_f', 'air_f')
+
+# One hour of prompt data in imperial units; field names are the prompt JSON keys
+ConvertedHour = namedtuple(
+    'ConvertedHour',
+    't wh_ft wp_s wd_deg ws_mph wdir_deg water_f air_f p_mb hum_pct vis_mi cloud_pct'
+)
+_hourly_row = attrgetter(*_HOURLY_COLUMNS)
+
+
+def _noaa(hour: Dict, key: str, default=None):
+    """Return an hour's NOAA value for a Stormglass field, or default if it is missing."""
+    field = hour.get(key)
+    return field['noaa'] if field and 'noaa' in field else default
+
+
+def _json_dumps(obj) -> str:
+    """Serialize obj as compact JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+def _converted(hours: List[Dict], key: str, factor: float, offset: float = 0.0) -> list:
+    """Convert one metric across hours to imperial, rounded to 0.1; missing or zero values become None."""
+    values = np.fromiter(
+        (math.nan if value in ('N/A', 0) else value
+         for value in (_noaa(hour, key, 0) for hour in hours)),
+        dtype=np.float64,
+        count=len(hours)
+    )
+    # Python's round (not np.round) so values match the scalar conversions, e.g. 68.45 -> 68.5
+    return [None if math.isnan(value) else round(value, 1) for value in (values * factor + offset).tolist()]
+
+
+
+def _convert_hours(hours: List[Dict]) -> List[ConvertedHour]:
+    """
+    Convert Stormglass hours to imperial prompt values, one vectorized pass per metric.
+    
+    Args:
+        hours: Stormglass hour dictionaries
+        
+    Returns:
+        One ConvertedHour per input hour
+    """
+    return [
+        ConvertedHour(*values)
+        for values in zip(
+            [hour['time'][:16] if hour.get('time') else None for hour in hours],
+            _converted(hours, 'waveHeight', _M_TO_FT),
+            [_noaa(hour, 'wavePeriod') for hour in hours],
+            [_noaa(hour, 'waveDirection') for hour in hours],
+            _converted(hours, 'windSpeed', _MS_TO_MPH),
+            [_noaa(hour, 'windDirection') for hour in hours],
+            _converted(hours, 'waterTemperature', _C_TO_F_FACTOR, _C_TO_F_OFFSET),
+            _converted(hours, 'airTemperature', _C_TO_F_FACTOR, _C_TO_F_OFFSET),
+            [_noaa(hour, 'pressure') for hour in hours],
+            [_noaa(hour, 'humidity') for hour in hours],
+            _converted(hours, 'visibility', _KM_TO_MI),
+            [_noaa(hour, 'cloudCover') for hour in hours]
+        )
+    ]
 
 class SurfSummarizer:
     """Summarizer for surf conditions using Google Gemini."""
@@ -26,6 +121,13 @@ class SurfSummarizer:
             raise ValueError("Gemini API key is required. Set GEMINI_API_KEY environment variable or pass api_key parameter.")
         
         self.client = genai.Client(api_key=api_key)
+        
+        # Runs the one-sentence summary request alongside the full analysis in get_combined
+        self._executor = ThreadPoolExecutor(max_workers=4)
+    
+    def close(self) -> None:
+        """Shut down the worker threads used by get_combined."""
+        self._executor.shutdown(wait=True)
     
     def _search_break_specific_conditions(self, beach_name: str) -> str:
         """
@@ -60,31 +162,25 @@ class SurfSummarizer:
                                     'url': result.get('href', '')
                                 })
                         except Exception as e:
-                            print(f"Error searching for query '{query}': {e}")
+                            logger.warning("Error searching for query '%s': %s", query, e)
                             continue
                 
                 # Format results as a string for the extraction prompt
                 if all_results:
-                    formatted_results = []
-                    for i, result in enumerate(all_results[:15], 1):  # Limit to 15 results
-                        formatted_results.append(
-                            f"Result {i}:\n"
-                            f"Title: {result['title']}\n"
-                            f"URL: {result['url']}\n"
-                            f"Content: {result['body']}\n"
-                        )
-                    return "\n\n".join(formatted_results)
+                    return "\n\n".join(
+                        _SEARCH_RESULT_FMT(i, result['title'], result['url'], result['body'])
+                        for i, result in enumerate(all_results[:15], 1)  # Limit to 15 results
+                    )
                 else:
                     return ""
                     
             except ImportError:
                 # Fallback: duckduckgo-search not installed
-                print("⚠️ duckduckgo-search not installed. Install with: pip install duckduckgo-search")
-                print("   Continuing without break-specific web search...")
+                logger.warning("⚠️ duckduckgo-search not installed (pip install duckduckgo-search); continuing without break-specific web search")
                 return ""
                 
         except Exception as e:
-            print(f"Error searching for break-specific conditions: {e}")
+            logger.warning("Error searching for break-specific conditions: %s", e)
             return ""
     
     def _extract_break_specific_conditions(self, beach_name: str, search_results: str) -> str:
@@ -102,21 +198,92 @@ class SurfSummarizer:
             if not search_results or search_results.strip() == "":
                 return "No break-specific information available. Using general surf forecasting principles."
             
-            prompt = BREAK_SPECIFIC_CONDITIONS_EXTRACTION_PROMPT.format(
+            prompt = render_break_specific_conditions_extraction_prompt(
                 beach_name=beach_name,
                 search_results=search_results
             )
             
             response = self.client.models.generate_content(
-                model='gemini-2.0-flash-001',
+                model=_GEMINI_MODEL,
                 contents=prompt
             )
             return response.text
         except Exception as e:
-            print(f"Error extracting break-specific conditions: {e}")
+            logger.warning("Error extracting break-specific conditions: %s", e)
             return "Error extracting break-specific conditions. Using general surf forecasting principles."
     
-    def get_surf_conditions(self, surf_beach: str, surf_data: dict = None, selected_date: str = None, use_break_specific: bool = True) -> tuple:
+    def _surf_conditions_prompt(self, surf_beach: str, surf_data: dict = None, selected_date: str = None,
+                                use_break_specific: bool = True, formatted_data: Optional[str] = None) -> tuple:
+        """
+        Build the surf conditions prompt, looking up break-specific conditions if enabled.
+        
+        Args:
+            surf_beach: Name of the surf beach/break
+            surf_data: Real surf data from Stormglass API (optional)
+            selected_date: Selected date for analysis (optional)
+            use_break_specific: Whether to search for break-specific conditions
+            formatted_data: Surf data already formatted by _format_surf_data (optional)
+            
+        Returns:
+            Tuple of (prompt, break_specific_conditions)
+        """
+        if not surf_data:
+            # Fallback to general knowledge if no data provided
+            return f"Provide general surf information about {surf_beach} surf break.", ""
+        
+        # Step 1: Get break-specific conditions (if enabled)
+        break_specific_conditions = "No break-specific information available. Using general surf forecasting principles."
+        
+        if use_break_specific:
+            logger.debug("🔍 Searching for break-specific conditions for %s...", surf_beach)
+            search_results = self._search_break_specific_conditions(surf_beach)
+            
+            if search_results:
+                logger.debug("📝 Extracting break-specific conditions from search results...")
+                break_specific_conditions = self._extract_break_specific_conditions(surf_beach, search_results)
+                logger.debug("✅ Break-specific conditions extracted")
+            else:
+                logger.debug("⚠️ No search results found, using general principles")
+        
+        # Format the surf data for the prompt
+        if formatted_data is None:
+            formatted_data = self._format_surf_data(surf_data)
+        
+        # Step 2: Build final forecast prompt with break-specific conditions
+        prompt = render_surf_conditions_prompt(
+            surf_beach=surf_beach,
+            break_specific_conditions=break_specific_conditions,
+            surf_data=formatted_data,
+            selected_date=selected_date or "today"
+        )
+        return prompt, break_specific_conditions
+    
+    def _one_sentence_summary_prompt(self, beach_name: str, surf_data: dict, selected_date: str = None,
+                                     formatted_data: Optional[str] = None) -> str:
+        """
+        Build the one-sentence summary prompt.
+        
+        Args:
+            beach_name: Name of the surf beach/break
+            surf_data: Real surf data from API
+            selected_date: Selected date for analysis (optional)
+            formatted_data: Surf data already formatted by _format_surf_data (optional)
+            
+        Returns:
+            Prompt string
+        """
+        # Format the surf data for the prompt
+        if formatted_data is None:
+            formatted_data = self._format_surf_data(surf_data)
+        
+        return render_one_sentence_summary_prompt(
+            beach_name=beach_name,
+            formatted_conditions=formatted_data,
+            selected_date=selected_date or "today"
+        )
+    
+    def get_surf_conditions(self, surf_beach: str, surf_data: dict = None, selected_date: str = None, use_break_specific: bool = True,
+                            formatted_data: Optional[str] = None) -> tuple:
         """
         Get surf conditions summary for a specific beach using real surf data.
         
@@ -124,50 +291,50 @@ class SurfSummarizer:
             surf_beach: Name of the surf beach/break
             surf_data: Real surf data from Stormglass API (optional)
             selected_date: Selected date for analysis (optional)
+            formatted_data: Surf data already formatted by _format_surf_data (optional)
             
         Returns:
             Tuple of (surf conditions summary, break_specific_conditions)
         """
         try:
-            if surf_data:
-                # Step 1: Get break-specific conditions (if enabled)
-                break_specific_conditions = "No break-specific information available. Using general surf forecasting principles."
-                
-                if use_break_specific:
-                    print(f"🔍 Searching for break-specific conditions for {surf_beach}...")
-                    search_results = self._search_break_specific_conditions(surf_beach)
-                    
-                    if search_results:
-                        print(f"📝 Extracting break-specific conditions from search results...")
-                        break_specific_conditions = self._extract_break_specific_conditions(surf_beach, search_results)
-                        print(f"✅ Break-specific conditions extracted")
-                    else:
-                        print(f"⚠️ No search results found, using general principles")
-                
-                # Format the surf data for the prompt
-                formatted_data = self._format_surf_data(surf_data)
-                
-                # Step 2: Generate final forecast with break-specific conditions
-                prompt = SURF_CONDITIONS_PROMPT.format(
-                    surf_beach=surf_beach,
-                    break_specific_conditions=break_specific_conditions,
-                    surf_data=formatted_data,
-                    selected_date=selected_date or "today"
-                )
-            else:
-                # Fallback to general knowledge if no data provided
-                prompt = f"Provide general surf information about {surf_beach} surf break."
-                break_specific_conditions = ""
-            
+            prompt, break_specific_conditions = self._surf_conditions_prompt(
+                surf_beach, surf_data, selected_date, use_break_specific, formatted_data
+            )
             response = self.client.models.generate_content(
-                model='gemini-2.0-flash-001',
+                model=_GEMINI_MODEL,
                 contents=prompt
             )
             return response.text, break_specific_conditions
         except Exception as e:
             return f"Error generating surf conditions: {str(e)}", ""
     
-    def get_one_sentence_summary(self, beach_name: str, surf_data: dict, selected_date: str = None) -> str:
+    def stream_surf_conditions(self, surf_beach: str, surf_data: dict = None, selected_date: str = None, use_break_specific: bool = True,
+                               formatted_data: Optional[str] = None) -> Iterator[str]:
+        """
+        Stream the surf conditions summary as Gemini generates it.
+        Use get_surf_conditions when the full text is needed at once (e.g. for
+        parse_best_times_from_analysis).
+        
+        Args:
+            surf_beach: Name of the surf beach/break
+            surf_data: Real surf data from Stormglass API (optional)
+            selected_date: Selected date for analysis (optional)
+            use_break_specific: Whether to search for break-specific conditions
+            formatted_data: Surf data already formatted by _format_surf_data (optional)
+            
+        Yields:
+            Chunks of the surf conditions summary text
+        """
+        try:
+            prompt, _ = self._surf_conditions_prompt(
+                surf_beach, surf_data, selected_date, use_break_specific, formatted_data
+            )
+            yield from self._stream_text(prompt)
+        except Exception as e:
+            yield f"Error generating surf conditions: {str(e)}"
+    
+    def get_one_sentence_summary(self, beach_name: str, surf_data: dict, selected_date: str = None,
+                                 formatted_data: Optional[str] = None) -> str:
         """
         Get a one-sentence summary of surf conditions.
         
@@ -175,31 +342,63 @@ class SurfSummarizer:
             beach_name: Name of the surf beach/break
             surf_data: Real surf data from API
             selected_date: Selected date for analysis (optional)
+            formatted_data: Surf data already formatted by _format_surf_data (optional)
             
         Returns:
             One-sentence summary of surf conditions
         """
         try:
-            # Format the surf data for the prompt
-            formatted_data = self._format_surf_data(surf_data)
-            
-            prompt = ONE_SENTENCE_SUMMARY_PROMPT.format(
-                beach_name=beach_name,
-                formatted_conditions=formatted_data,
-                selected_date=selected_date or "today"
-            )
-            
+            prompt = self._one_sentence_summary_prompt(beach_name, surf_data, selected_date, formatted_data)
             response = self.client.models.generate_content(
-                model='gemini-2.0-flash-001',
+                model=_GEMINI_MODEL,
                 contents=prompt
             )
             return response.text
         except Exception as e:
             return f"Error generating summary: {str(e)}"
     
+    def _stream_text(self, prompt: str) -> Iterator[str]:
+        """
+        Yield response text from Gemini as chunks arrive.
+        
+        Args:
+            prompt: Prompt to send
+            
+        Yields:
+            Non-empty text chunks of the response
+        """
+        for chunk in self.client.models.generate_content_stream(model=_GEMINI_MODEL, contents=prompt):
+            if chunk.text:
+                yield chunk.text
+    
+    def get_combined(self, beach_name: str, surf_data: dict, selected_date: str = None, use_break_specific: bool = True) -> tuple:
+        """
+        Get the full surf conditions analysis and the one-sentence summary together.
+        The two Gemini requests are independent, so the summary is generated in a
+        worker thread while the analysis runs in the calling thread.
+        
+        Args:
+            beach_name: Name of the surf beach/break
+            surf_data: Real surf data from API
+            selected_date: Selected date for analysis (optional)
+            use_break_specific: Whether to search for break-specific conditions
+            
+        Returns:
+            Tuple of (surf conditions summary, break_specific_conditions, one-sentence summary)
+        """
+        formatted_data = self._format_surf_data(surf_data) if surf_data else None
+        summary_future = self._executor.submit(
+            self.get_one_sentence_summary, beach_name, surf_data, selected_date, formatted_data
+        )
+        analysis, break_specific_conditions = self.get_surf_conditions(
+            beach_name, surf_data, selected_date, use_break_specific, formatted_data
+        )
+        return analysis, break_specific_conditions, summary_future.result()
+    
     def _format_surf_data(self, surf_data: dict) -> str:
         """
-        Format surf data into a readable string for the AI prompt.
+        Build the compact JSON surf data for the AI prompt (keys are described by
+        SURF_DATA_LEGEND in the prompt templates).
         
         Args:
             surf_data: Dictionary containing surf data from Stormglass API
@@ -225,68 +424,18 @@ class SurfSummarizer:
             if not hours_data:
                 return "No surf data available for this location and date."
             
-            # Get current conditions (first hour)
-            current_hour = hours_data[0]
+            # Convert the first 6 hours; the first hour is reported as the current conditions
+            converted = _convert_hours(hours_data[:6])
+            current = converted[0]._asdict()
+            del current['t']
             
-            # Convert metric to imperial units
-            wave_height_m = current_hour.get('waveHeight', {}).get('noaa', 0)
-            wave_height_ft = round(float(wave_height_m) * 3.28084, 1) if wave_height_m != 'N/A' and wave_height_m != 0 else 'N/A'
+            # Hourly rows follow the header flattened in _HOURLY_COLUMNS order (JSONH layout)
+            hourly = [len(_HOURLY_COLUMNS), *_HOURLY_COLUMNS]
+            for hour in converted:
+                hourly.extend(_hourly_row(hour))
             
-            wind_speed_ms = current_hour.get('windSpeed', {}).get('noaa', 0)
-            wind_speed_mph = round(float(wind_speed_ms) * 2.23694, 1) if wind_speed_ms != 'N/A' and wind_speed_ms != 0 else 'N/A'
-            
-            water_temp_c = current_hour.get('waterTemperature', {}).get('noaa', 0)
-            water_temp_f = round((float(water_temp_c) * 9/5) + 32, 1) if water_temp_c != 'N/A' and water_temp_c != 0 else 'N/A'
-            
-            air_temp_c = current_hour.get('airTemperature', {}).get('noaa', 0)
-            air_temp_f = round((float(air_temp_c) * 9/5) + 32, 1) if air_temp_c != 'N/A' and air_temp_c != 0 else 'N/A'
-            
-            visibility_km = current_hour.get('visibility', {}).get('noaa', 0)
-            visibility_mi = round(float(visibility_km) * 0.621371, 1) if visibility_km != 'N/A' and visibility_km != 0 else 'N/A'
-            
-            formatted = f"""
-CURRENT CONDITIONS (from Stormglass API):
-- Wave Height: {wave_height_ft} ft
-- Wave Period: {current_hour.get('wavePeriod', {}).get('noaa', 'N/A')} sec
-- Wave Direction: {current_hour.get('waveDirection', {}).get('noaa', 'N/A')}°
-- Wind Speed: {wind_speed_mph} mph
-- Wind Direction: {current_hour.get('windDirection', {}).get('noaa', 'N/A')}°
-- Water Temperature: {water_temp_f}°F
-- Air Temperature: {air_temp_f}°F
-- Pressure: {current_hour.get('pressure', {}).get('noaa', 'N/A')} mb
-- Humidity: {current_hour.get('humidity', {}).get('noaa', 'N/A')}%
-- Visibility: {visibility_mi} mi
-- Cloud Cover: {current_hour.get('cloudCover', {}).get('noaa', 'N/A')}%
-
-HOURLY FORECAST (Next 6 Hours):
-"""
-            
-            # Add next 6 hours of data
-            for i, hour in enumerate(hours_data[:6]):
-                time_str = hour.get('time', 'N/A')[:16] if hour.get('time') else 'N/A'
-                
-                # Convert hourly data to imperial units
-                hour_wave_height_m = hour.get('waveHeight', {}).get('noaa', 0)
-                hour_wave_height_ft = round(float(hour_wave_height_m) * 3.28084, 1) if hour_wave_height_m != 'N/A' and hour_wave_height_m != 0 else 'N/A'
-                
-                hour_wind_speed_ms = hour.get('windSpeed', {}).get('noaa', 0)
-                hour_wind_speed_mph = round(float(hour_wind_speed_ms) * 2.23694, 1) if hour_wind_speed_ms != 'N/A' and hour_wind_speed_ms != 0 else 'N/A'
-                
-                hour_water_temp_c = hour.get('waterTemperature', {}).get('noaa', 0)
-                hour_water_temp_f = round((float(hour_water_temp_c) * 9/5) + 32, 1) if hour_water_temp_c != 'N/A' and hour_water_temp_c != 0 else 'N/A'
-                
-                hour_air_temp_c = hour.get('airTemperature', {}).get('noaa', 0)
-                hour_air_temp_f = round((float(hour_air_temp_c) * 9/5) + 32, 1) if hour_air_temp_c != 'N/A' and hour_air_temp_c != 0 else 'N/A'
-                
-                formatted += f"""
-Hour {i+1} ({time_str}):
-- Waves: {hour_wave_height_ft}ft @ {hour.get('wavePeriod', {}).get('noaa', 'N/A')}s
-- Wind: {hour_wind_speed_mph} mph @ {hour.get('windDirection', {}).get('noaa', 'N/A')}°
-- Water Temp: {hour_water_temp_f}°F
-- Air Temp: {hour_air_temp_f}°F
-"""
-            
-            return formatted
+            compact = {'current': current, 'hourly': hourly}
+            return _json_dumps(compact)
             
         except Exception as e:
             return f"Error formatting surf data: {str(e)}"
@@ -301,142 +450,11 @@ Hour {i+1} ({time_str}):
         Returns:
             List of dictionaries with best times data
         """
-        best_times = []
-        
         try:
-            # Look for the "Best Time to Surf" section (singular - only one time)
-            # Pattern to match the section that comes after "2. **Best Time to Surf:**" or "Best Time to Surf:**"
-            # The new format has the time after the colon: "Best Time to Surf:** 8:00 AM - 9:00 AM"
-            best_times_pattern = r'(?i)(?:2\.\s*\*\*best time to surf\*\*:?\s*\*\*|best time to surf:?\s*\*\*)[:\s]*(.*?)(?=\*\*3\.|3\.\s*\*\*|specific recommendations|notable changes|$)'
-            
-            # Find the best times section
-            best_times_match = re.search(best_times_pattern, ai_analysis_text, re.DOTALL)
-            
-            if not best_times_match:
-                # Try alternative patterns (handle variations)
-                best_times_pattern = r'(?i)(?:2\.\s*\*\*best times to surf\*\*:|best times to surf:)[:\s]*(.*?)(?=\*\*3\.|3\.\s*\*\*|specific recommendations|notable changes|$)'
-                best_times_match = re.search(best_times_pattern, ai_analysis_text, re.DOTALL)
-            
-            if not best_times_match:
-                # Try without colon
-                best_times_pattern = r'(?i)best time to surf.*?\n(.*?)(?=\n\*\*|\n\d+\.\s*\*\*|specific recommendations|notable changes|$)'
-                best_times_match = re.search(best_times_pattern, ai_analysis_text, re.DOTALL)
-            
-            if not best_times_match:
-                return []
-            
-            best_times_section = best_times_match.group(1)
-            
-            # The new format has the time at the start after "Best Time to Surf:"
-            # Format: "Best Time to Surf: 8:00 AM - 9:00 AM\n    *   Rating: 80/100\n    ..."
-            # Since we're only getting ONE time, the entire section is one entry
-            # Extract time from the beginning of the section (could be on same line or next line)
-            time_at_start = re.search(r'^([0-9]{1,2}[:.]?[0-9]{0,2}\s*(?:AM|PM|am|pm)?(?:\s*[-–—]\s*[0-9]{1,2}[:.]?[0-9]{0,2}\s*(?:AM|PM|am|pm))?)[:\s]*', best_times_section, re.IGNORECASE | re.MULTILINE)
-            
-            if time_at_start:
-                # Single entry - the entire section
-                entries = [best_times_section]
-            else:
-                # Fallback: try finding time ranges with colons or list format
-                time_pattern = r'([0-9]{1,2}[:.]?[0-9]{0,2}\s*(?:AM|PM|am|pm)?(?:\s*[-–—]\s*[0-9]{1,2}[:.]?[0-9]{0,2}\s*(?:AM|PM|am|pm))?):?'
-                matches = list(re.finditer(time_pattern, best_times_section, re.IGNORECASE))
-                
-                if matches:
-                    entries = []
-                    for i, match in enumerate(matches):
-                        start = match.start()
-                        end = matches[i + 1].start() if i + 1 < len(matches) else len(best_times_section)
-                        entries.append(best_times_section[start:end])
-                else:
-                    # No time found, use entire section as one entry
-                    entries = [best_times_section]
-            
-            for entry_text in entries:
-                entry_text = entry_text.strip()
-                if not entry_text:
-                    continue
-                
-                # Extract time - in new format it's at the start: "8:00 AM - 9:00 AM\n    *   Rating:..."
-                # Or could be: "Best Time to Surf: 8:00 AM - 9:00 AM" (already extracted in section)
-                time_match = re.search(r'([0-9]{1,2}[:.]?[0-9]{0,2}\s*(?:AM|PM|am|pm)?(?:\s*[-–—]\s*[0-9]{1,2}[:.]?[0-9]{0,2}\s*(?:AM|PM|am|pm))?)[:\s]*', entry_text, re.IGNORECASE)
-                if not time_match:
-                    continue
-                
-                time_str = time_match.group(1).strip()
-                # Clean up time if it has a trailing colon
-                if time_str.endswith(':'):
-                    time_str = time_str[:-1].strip()
-                
-                # Extract rating (1-100) - handle formats like "*   Rating: 80/100" or "Rating: 80"
-                rating_match = re.search(r'(?:\*\s*)?(?:rating|score|rated)[:\s]*(\d{1,3})(?:\s*/?\s*100)?', entry_text, re.IGNORECASE)
-                rating = int(rating_match.group(1)) if rating_match else None
-                
-                # Extract wave height range - handle formats like "*   Wave Height: 5.6-5.7ft"
-                wave_match = re.search(r'(?:\*\s*)?wave[^\d]*?(?:height|size)?[:\s]*(\d+\.?\d*\s*[-–—]\s*\d+\.?\d*ft)', entry_text, re.IGNORECASE)
-                if not wave_match:
-                    # Fallback to single value
-                    wave_match = re.search(r'(?:\*\s*)?wave[^\d]*?(?:height|size)?[:\s]*(\d+\.?\d*ft)', entry_text, re.IGNORECASE)
-                wave_height_range = wave_match.group(1).strip() if wave_match else None
-                
-                # Extract period - handle formats like "*   Wave Period: 12s"
-                period_match = re.search(r'(?:\*\s*)?period[^\d]*?[:\s]*(\d+)\s*s(?:ec(?:ond)?s?)?', entry_text, re.IGNORECASE)
-                period = int(period_match.group(1)) if period_match else None
-                
-                # Extract wind speed range - handle formats like "*   Wind Speed: 2.9-3.3mph"
-                wind_match = re.search(r'(?:\*\s*)?wind[^\d]*?(?:speed)?[:\s]*(\d+\.?\d*\s*[-–—]\s*\d+\.?\d*mph)', entry_text, re.IGNORECASE)
-                if not wind_match:
-                    # Fallback to single value
-                    wind_match = re.search(r'(?:\*\s*)?wind[^\d]*?(?:speed)?[:\s]*(\d+\.?\d*mph)', entry_text, re.IGNORECASE)
-                wind_speed_range = wind_match.group(1).strip() if wind_match else None
-                
-                # Extract explanation - look for "Explanation:" marker
-                explanation_match = re.search(r'explanation[:\s]+(.+?)(?=\n\s*(?:specific recommendations|notable changes|\d+\.\s*\*\*|$))', entry_text, re.IGNORECASE | re.DOTALL)
-                if not explanation_match:
-                    # Fallback: find "Explanation:" anywhere and get everything after
-                    explanation_match = re.search(r'(?:\*\*)?explanation[:\s]+(.+)', entry_text, re.IGNORECASE | re.DOTALL)
-                
-                if explanation_match:
-                    reason = explanation_match.group(1).strip()
-                else:
-                    # Fallback: try old format with "reason" keyword
-                    reason_match = re.search(r'(?:reason|explanation)[:\s]+(.+)', entry_text, re.IGNORECASE | re.DOTALL)
-                    if reason_match:
-                        reason = reason_match.group(1).strip()
-                    else:
-                        reason = None
-                
-                # Clean up the explanation text - preserve newlines but clean up markdown
-                if reason:
-                    # Remove markdown formatting
-                    reason = re.sub(r'\*\*', '', reason)
-                    reason = re.sub(r'\*', '', reason)
-                    # Preserve newlines but normalize multiple spaces within lines
-                    # Replace multiple spaces with single space, but keep newlines
-                    reason = re.sub(r'[ \t]+', ' ', reason)  # Normalize spaces/tabs but keep newlines
-                    reason = re.sub(r'\n[ \t]*\n+', '\n\n', reason)  # Normalize multiple newlines to double newline max
-                    reason = reason.strip()
-                    # Remove trailing colons
-                    reason = re.sub(r'[:]\s*$', '', reason).strip()
-                
-                # Only add if we have at least a time
-                if time_str:
-                    best_times.append({
-                        'time': time_str,
-                        'rating': rating,
-                        'wave_height_range': wave_height_range,
-                        'period': period,
-                        'wind_speed_range': wind_speed_range,
-                        'reason': reason if reason else None
-                    })
-            
-            # Sort by rating (highest first)
-            best_times.sort(key=lambda x: x.get('rating', 0) or 0, reverse=True)
-            
-            # Return only the single best time
-            return best_times[:1] if best_times else []
+            return parse_best_times(ai_analysis_text)
             
         except Exception as e:
-            print(f"Error parsing best times from AI analysis: {e}")
+            logger.warning("Error parsing best times from AI analysis: %s", e)
             import traceback
             traceback.print_exc()
             return []
@@ -169,6 +169,7 @@ const SurfPage = () => {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
   const [surfData, setSurfData] = useState(null);
+  const [tideData, setTideData] = useState(null);
 
   const handleSubmit = async (e) => {
     e.preventDefault();
@@ -177,6 +178,10 @@ const SurfPage = () => {
     setLoading(true);
     setError('');
     
+    // Tide data loads in parallel and fills in the chart whenever it arrives
+    setTideData(null);
+    surfApi.getTideData(beachName, selectedDate).then(setTideData);
+    
     try {
       const data = await surfApi.getSurfData(beachName, selectedDate);
       setSurfData(data);
@@ -277,7 +282,7 @@ const SurfPage = () => {
           {/* Wave Height Chart */}
           <WaveHeightChart 
             hourlyForecast={surfData.hourlyForecast} 
-            tideData={surfData.tideData}
+            tideData={tideData}
           />
 
           {/* Best Surf Times */}
@@ -27,6 +27,23 @@ class SurfApiService {
     }
   }
 
+  // Get tide data for a specific beach and date (requested alongside getSurfData)
+  async getTideData(beachName, date) {
+    try {
+      const response = await fetch(`${API_BASE_URL}/api/tide/${beachName}/${date}`);
+      
+      if (!response.ok) {
+        throw new Error('Failed to fetch tide data');
+      }
+      
+      return await response.json();
+      
+    } catch (error) {
+      console.error('❌ Error fetching tide data:', error);
+      return {};
+    }
+  }
+
   // Mock data that matches your Python API structure
   getMockSurfData(beachName, date) {
     return {
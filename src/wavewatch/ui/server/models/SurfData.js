@@ -46,13 +46,11 @@ const surfDataSchema = new mongoose.Schema({
   }],
   best_surf_times: [{
     time: String,
-    wave_height: Number,
-    wave_period: Number,
-    wind_speed: Number,
-    wind_direction: Number,
-    water_temperature: Number,
-    tide: { type: mongoose.Schema.Types.Mixed }, // Allow Number or String
-    score: Number
+    rating: Number,
+    wave_height_range: String,
+    period: Number,
+    wind_speed_range: String,
+    reason: String
   }],
   ai_analysis: {
     text: String,
@@ -62,6 +60,7 @@ const surfDataSchema = new mongoose.Schema({
     notable_changes: String
   },
   one_sentence_summary: String,
+  rendered: String, // Serialized API response (camelCase, without tide data) served as-is on cache hits
   cached: {
     type: Boolean,
     default: true
@@ -6,8 +6,11 @@ echo "📡 API will be available at: http://localhost:8000"
 echo "📚 API docs available at: http://localhost:8000/docs"
 echo ""
 
-# Install FastAPI dependencies if needed
-pip install fastapi uvicorn
+# Dependencies are installed once by setup.sh, not on every start
+if ! python -c "import wavewatch" 2>/dev/null; then
+    echo "❌ The wavewatch package is not installed. Run ./setup.sh first."
+    exit 1
+fi
 
 # Start the API server
 python surf_api.py
@@ -298,9 +298,8 @@ def main():
             else:
                 with st.spinner("Fetching surf conditions..."):
                     try:
-                        # Initialize data fetcher and summarizer
+                        # Initialize data fetcher
                         data_fetcher = StormglassDataFetcher(api_key=stormglass_api_key)
-                        summarizer = SurfSummarizer(api_key=gemini_api_key)
                         
                         # Store in session state for display
                         st.session_state.beach = surf_beach
@@ -318,12 +317,13 @@ def main():
                         
                         # Get AI analysis with real surf data
                         if show_ai_analysis:
-                            # Combine current and hourly data for AI analysis
-                            combined_data = {
+                            # Combine current and hourly data for AI analysis; the analysis itself
+                            # is streamed into the results panel below
+                            st.session_state.ai_surf_data = {
                                 'current_conditions': st.session_state.real_data.get('current_conditions', {}),
                                 'hourly_conditions': st.session_state.hourly_data.get('hourly_conditions', [])
                             }
-                            st.session_state.ai_analysis = summarizer.get_surf_conditions(surf_beach, combined_data, selected_date)
+                            st.session_state.ai_analysis = None
                         
                     except Exception as e:
                         st.error(f"Error: {str(e)}")
@@ -466,7 +466,18 @@ def main():
             if st.session_state.show_ai_analysis and hasattr(st.session_state, 'ai_analysis'):
                 st.markdown("### 🤖 AI Surf Analysis")
                 st.markdown("---")
-                st.markdown(st.session_state.ai_analysis)
+                if st.session_state.ai_analysis is None:
+                    # Show the analysis as Gemini writes it; later reruns reuse the full text
+                    summarizer = SurfSummarizer(api_key=os.getenv('GEMINI_API_KEY'))
+                    st.session_state.ai_analysis = st.write_stream(
+                        summarizer.stream_surf_conditions(
+                            st.session_state.beach,
+                            st.session_state.ai_surf_data,
+                            st.session_state.selected_date
+                        )
+                    )
+                else:
+                    st.markdown(st.session_state.ai_analysis)
                 
                 # Add a download button for the AI analysis
                 st.download_button(
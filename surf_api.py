@@ -4,177 +4,509 @@ FastAPI wrapper for WaveWatch surf data API
 This provides a REST API endpoint for the React frontend to consume
 """
 
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Path, Request, Response
+from cachetools import TTLCache
+from motor.motor_asyncio import AsyncIOMotorClient
+from pydantic import BeforeValidator
+from pymongo import ReplaceOne
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import uvicorn
-import sys
 import os
-
-# Add the src directory to Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+import json
+import logging
+import logging.handlers
+import queue
+import atexit
+import asyncio
+import hashlib
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Annotated, Dict, Optional, Tuple
 
 from wavewatch.api.data_fetcher import StormglassDataFetcher
 from wavewatch.llm.summarizer import SurfSummarizer
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import date as Date, datetime, timedelta, timezone
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
 
 # Load environment variables
 load_dotenv()
 
+
+def _json_dumps(obj) -> bytes:
+    """Encode an object as JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+class _JsonFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects for log aggregation."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return _json_dumps(entry).decode('utf-8')
+
+
+def _configure_logging() -> logging.handlers.QueueListener:
+    """
+    Route log records through a queue so request handlers never block on stdout; a
+    background listener thread does the writing. Set LOG_FORMAT=json for JSON lines.
+    
+    Returns:
+        The started queue listener
+    """
+    stream_handler = logging.StreamHandler()
+    if os.getenv('LOG_FORMAT', '').lower() == 'json':
+        stream_handler.setFormatter(_JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    
+    log_queue = queue.SimpleQueue()
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # flush queued records on exit
+    return listener
+
+
+_log_listener = _configure_logging()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+# MongoDB cache connection; documents share the collection used by the Express server's
+# SurfData model
+_MONGODB_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/wavewatch')
+_SURF_COLLECTION = 'surfdatas'
+
+# Cached documents expire after 24 hours, matching the SurfData model default; MongoDB's TTL
+# monitor removes them once expires_at passes
+_CACHE_EXPIRY = timedelta(hours=24)
+
+
+# Cache reads are bounded; after repeated failures they are skipped for a cooldown period and
+# then retried (half-open). The default timeout leaves room for a remote (e.g. Atlas) cluster
+_CACHE_READ_TIMEOUT = float(os.getenv('WAVEWATCH_CACHE_READ_TIMEOUT', '1.5'))  # seconds
+_CACHE_BREAKER_THRESHOLD = 3
+_CACHE_BREAKER_COOLDOWN = 10  # seconds
+_cache_breaker = {"fails": 0, "open_until": 0.0}
+
+
+def _surf_filter(beach_name: str, date: str) -> dict:
+    """Build the MongoDB query for a beach/date (the SurfData model stores names lowercased)."""
+    return {"beach_name": beach_name.strip().lower(), "date": date}
+
+
+# Cache writes are queued and flushed to MongoDB in batches, off the request path
+_CACHE_BATCH_SIZE = 32
+_CACHE_BATCH_MAX_WAIT = 0.1  # seconds
+_CACHE_QUEUE_SIZE = 1024
+
+
+async def _flush_cache_batch(surf_collection, batch: list):
+    """Upsert a batch of complete responses into MongoDB with a single bulk write."""
+    try:
+        now = datetime.now(timezone.utc)
+        operations = []
+        for cache_data in batch:
+            query = _surf_filter(cache_data['beach_name'], cache_data['date'])
+            document = {
+                **cache_data,
+                **query,
+                "cached": True,
+                "created_at": now,
+                "expires_at": now + _CACHE_EXPIRY
+            }
+            operations.append(ReplaceOne(query, document, upsert=True))
+        
+        await surf_collection.bulk_write(operations, ordered=False)
+        logger.info("💾 Cached %d complete response(s) in MongoDB", len(batch))
+    except Exception as e:
+        logger.warning("⚠️ Could not cache in MongoDB: %s", e)
+
+
+async def _cache_writer(cache_queue: asyncio.Queue, surf_collection):
+    """
+    Drain the cache queue, flushing up to _CACHE_BATCH_SIZE documents at a time or whatever
+    arrived within _CACHE_BATCH_MAX_WAIT of the first one. A None item stops the writer
+    after flushing what it has.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await cache_queue.get()
+        if item is None:
+            return
+        
+        batch = [item]
+        stopping = False
+        deadline = loop.time() + _CACHE_BATCH_MAX_WAIT
+        while len(batch) < _CACHE_BATCH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(cache_queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+        
+        await _flush_cache_batch(surf_collection, batch)
+        if stopping:
+            return
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create the shared services and clients once per worker, index the cache and run the
+    batched cache writer; on shutdown flush pending writes and close every client.
+    """
+    state = app.state
+    state.data_fetcher = StormglassDataFetcher()
+    state.summarizer = SurfSummarizer()
+    
+    # The beach list is fixed at startup, so encode the response once
+    state.beaches = _json_dumps({"beaches": list(state.data_fetcher.beach_coordinates.keys())})
+    
+    # Dedicated pool for Gemini calls; they are remote and I/O-bound, so threads suffice and
+    # slow generations cannot starve the default executor used for the data fetcher
+    state.llm_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm")
+    
+    state.mongo_client = AsyncIOMotorClient(_MONGODB_URI, maxPoolSize=100, serverSelectionTimeoutMS=2000)
+    state.surf_collection = state.mongo_client.get_default_database('wavewatch')[_SURF_COLLECTION]
+    try:
+        await state.surf_collection.create_index([("beach_name", 1), ("date", 1)])
+        await state.surf_collection.create_index("expires_at", expireAfterSeconds=0)
+    except Exception as e:
+        logger.warning("⚠️ Could not create MongoDB indexes: %s", e)
+    
+    state.cache_queue = asyncio.Queue(maxsize=_CACHE_QUEUE_SIZE)
+    writer = asyncio.create_task(_cache_writer(state.cache_queue, state.surf_collection))
+    
+    yield
+    
+    await state.cache_queue.put(None)
+    await writer
+    state.mongo_client.close()
+    state.llm_pool.shutdown(wait=False)
+    await state.data_fetcher.aclose()
+    await asyncio.to_thread(state.data_fetcher.close)
+    await asyncio.to_thread(state.summarizer.close)
+
+
 # Initialize FastAPI app
-app = FastAPI(title="WaveWatch API", version="1.0.0")
+app = FastAPI(
+    title="WaveWatch API",
+    version="1.0.0",
+    lifespan=lifespan
+)
 
 # Add CORS middleware for React frontend
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],  # React dev server
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET"],  # the API is read-only
+    allow_headers=["content-type", "if-none-match"],
+    expose_headers=["ETag"],
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
-# Initialize services
-data_fetcher = StormglassDataFetcher()
-summarizer = SurfSummarizer()
+# Compress larger responses (hourly forecasts are repetitive JSON); added after CORS so it
+# wraps the CORS middleware and compresses the final response
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-@app.get("/")
-async def root():
-    return {"message": "🌊 WaveWatch API is running!", "version": "1.0.0"}
+# In-process cache of rendered response bodies keyed by (beach_name, date)
+_response_cache = TTLCache(maxsize=1024, ttl=60)
 
-@app.get("/api/surf/{beach_name}/{date}")
-async def get_surf_data(beach_name: str, date: str):
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+def _require_iso_date(value):
+    """Reject date path values that are not YYYY-MM-DD text before pydantic parses them."""
+    if not isinstance(value, str) or not _ISO_DATE_RE.fullmatch(value):
+        raise ValueError("date must be in YYYY-MM-DD format")
+    return value
+
+# Date path parameter: a bare Date would also accept timestamps like "0" and datetimes such as
+# "2024-01-05T00:00:00". pydantic applies a Path pattern only after parsing the date, so the
+# text is checked before parsing instead
+_DatePath = Annotated[Date, BeforeValidator(_require_iso_date), Path(description="Date in YYYY-MM-DD format")]
+
+# Encoded tide responses; predictions for a given date do not change, so they can be kept for hours
+_tide_cache = TTLCache(maxsize=1024, ttl=6 * 60 * 60)
+
+# Responses currently being built, so concurrent misses for the same key await one computation
+_inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+
+def _finish_inflight(cache_key: Tuple[str, str], build: asyncio.Future) -> None:
+    """Forget a finished response build so the next miss for its key starts a new one."""
+    if _inflight.get(cache_key) is build:
+        del _inflight[cache_key]
+    if not build.cancelled():
+        build.exception()  # mark retrieved so a failure nobody awaited is not logged as unhandled
+
+async def _fetch_tide_data(beach_name: str, date: str) -> dict:
+    """Fetch NOAA tide data in a worker thread, returning {} on any error."""
+    try:
+        tide_data = await asyncio.to_thread(app.state.data_fetcher._get_noaa_tide_data, beach_name, target_date=date)
+        return {} if 'error' in tide_data else tide_data
+    except Exception:
+        logger.exception("Error fetching tide data for %s on %s", beach_name, date)
+        return {}
+
+
+async def _read_cached_response(beach_name: str, date: str) -> Optional[bytes]:
     """
-    Get surf data for a specific beach and date
+    Look up a complete response in the MongoDB cache
+    
+    Args:
+        beach_name: Name of the beach
+        date: Date in YYYY-MM-DD format
+        
+    Returns:
+        JSON response body, or None on a cache miss or error
     """
     try:
-        # Validate date format
-        try:
-            datetime.strptime(date, '%Y-%m-%d')
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+        # Documents carry the pre-rendered response, which is passed through without re-encoding
+        query = _surf_filter(beach_name, date)
+        surf_collection = app.state.surf_collection
+        cached_doc = await asyncio.wait_for(surf_collection.find_one(query, {"rendered": 1}), _CACHE_READ_TIMEOUT)
+        _cache_breaker["fails"] = 0
         
-        # Check MongoDB cache first for complete response (industry standard: cache the full resource)
-        import requests
-        try:
-            cache_response = requests.get(f"http://localhost:5001/api/surf/{beach_name}/{date}", timeout=2)
-            if cache_response.status_code == 200:
-                cached_data = cache_response.json()
-                if cached_data and isinstance(cached_data, dict):
-                    print("📦 Using cached complete response from MongoDB")
-                    
-                    # Get tide data (not cached, fetch fresh as it's separate data source)
-                    tide_data = {}
-                    try:
-                        tide_data = data_fetcher._get_noaa_tide_data(beach_name, target_date=date)
-                        if 'error' in tide_data:
-                            tide_data = {}
-                    except Exception as e:
-                        tide_data = {}
-                    
-                    # Format response from cache
-                    ai_analysis_dict = cached_data.get('ai_analysis', {})
-                    ai_analysis = ai_analysis_dict.get('text', '') if isinstance(ai_analysis_dict, dict) else cached_data.get('ai_analysis', '')
-                    
-                    # Parse best times from cached AI analysis
-                    best_surf_times = summarizer.parse_best_times_from_analysis(ai_analysis) if ai_analysis else []
-                    
-                    # Handle both hourly_forecast (legacy) and hourly_conditions (schema) field names
-                    hourly_forecast = cached_data.get('hourly_conditions') or cached_data.get('hourly_forecast', [])
-                    
-                    return {
-                        "beachName": beach_name,
-                        "date": date,
-                        "currentConditions": cached_data.get('current_conditions', {}),
-                        "hourlyForecast": hourly_forecast,
-                        "bestSurfTimes": best_surf_times,
-                        "breakSpecificConditions": cached_data.get('break_specific_conditions', ''),
-                        "aiAnalysis": ai_analysis,
-                        "oneSentenceSummary": cached_data.get('one_sentence_summary', ''),
-                        "tideData": tide_data
-                    }
-        except Exception as e:
-            print(f"Warning: Could not check MongoDB cache: {e}")
+        if cached_doc and cached_doc.get('rendered'):
+            logger.info("📦 Using cached complete response from MongoDB")
+            return cached_doc['rendered'].encode('utf-8')
         
-        # Cache miss - fetch fresh data and generate AI analysis
-        print("🌊 Fetching fresh data from Stormglass API")
-        
-        # Get current conditions and hourly forecast
-        current_conditions_result = data_fetcher.get_current_conditions(beach_name, target_date=date)
-        hourly_forecast_result = data_fetcher.get_hourly_conditions(beach_name, target_date=date)
-        
-        current_conditions = current_conditions_result.get('current_conditions', {})
-        hourly_forecast = hourly_forecast_result.get('hourly_conditions', [])
-        
-        # Get surf data for AI analysis
-        surf_data_result = data_fetcher.fetch_surf_data(beach_name, target_date=date)
-        surf_data_for_ai = surf_data_result.get('data', {}) if 'error' not in surf_data_result else {}
-        
-        # Generate AI analysis
-        ai_analysis_text, break_specific_conditions = summarizer.get_surf_conditions(beach_name, surf_data_for_ai, date)
-        one_sentence_summary = summarizer.get_one_sentence_summary(beach_name, surf_data_for_ai, date)
-        best_surf_times = summarizer.parse_best_times_from_analysis(ai_analysis_text)
-        
-        # Get tide data
-        tide_data = {}
-        try:
-            tide_data = data_fetcher._get_noaa_tide_data(beach_name, target_date=date)
-            if 'error' in tide_data:
-                tide_data = {}
-        except Exception as e:
-            tide_data = {}
-        
-        # Cache complete response in MongoDB (using schema field names)
-        cache_data = {
-            "beach_name": beach_name,
-            "date": date,
-            "current_conditions": current_conditions,
-            "hourly_conditions": hourly_forecast,  # MongoDB schema uses hourly_conditions
-            "best_surf_times": best_surf_times,
-            "break_specific_conditions": break_specific_conditions,
-            "ai_analysis": {
-                "text": ai_analysis_text,
-                "overall_rating": "N/A",
-                "best_times": "N/A",
-                "recommendations": "N/A",
-                "notable_changes": "N/A"
-            },
-            "one_sentence_summary": one_sentence_summary
-        }
+        # Documents written before responses were pre-rendered only have the schema fields
+        if cached_doc:
+            cached_data = await asyncio.wait_for(surf_collection.find_one(query, {"_id": 0}), _CACHE_READ_TIMEOUT)
+            if cached_data and isinstance(cached_data, dict):
+                logger.info("📦 Using cached complete response from MongoDB")
+                
+                # Format response from cache
+                ai_analysis_dict = cached_data.get('ai_analysis', {})
+                ai_analysis = ai_analysis_dict.get('text', '') if isinstance(ai_analysis_dict, dict) else cached_data.get('ai_analysis', '')
+                
+                # Use the best times stored with the document; entries written through the old
+                # SurfData schema lost their rating, so re-parse the AI analysis for those
+                best_surf_times = cached_data.get('best_surf_times') or []
+                if not all('rating' in entry for entry in best_surf_times):
+                    best_surf_times = app.state.summarizer.parse_best_times_from_analysis(ai_analysis) if ai_analysis else []
+                
+                # Handle both hourly_forecast (legacy) and hourly_conditions (schema) field names
+                hourly_forecast = cached_data.get('hourly_conditions') or cached_data.get('hourly_forecast', [])
+                
+                response = {
+                    "beachName": beach_name,
+                    "date": date,
+                    "currentConditions": cached_data.get('current_conditions', {}),
+                    "hourlyForecast": hourly_forecast,
+                    "bestSurfTimes": best_surf_times,
+                    "breakSpecificConditions": cached_data.get('break_specific_conditions', ''),
+                    "aiAnalysis": ai_analysis,
+                    "oneSentenceSummary": cached_data.get('one_sentence_summary', '')
+                }
+                return _json_dumps(response)
+    except Exception as e:
+        # Stop checking the cache for a while after repeated failures
+        _cache_breaker["fails"] += 1
+        if _cache_breaker["fails"] >= _CACHE_BREAKER_THRESHOLD:
+            _cache_breaker["open_until"] = time.monotonic() + _CACHE_BREAKER_COOLDOWN
+        logger.warning("Could not check MongoDB cache: %r", e)
+    
+    return None
+
+
+async def _build_surf_response(beach_name: str, date: str, cache_key: tuple) -> bytes:
+    """
+    Build the surf response from the MongoDB cache, or fetch fresh data and generate AI analysis
+    
+    Args:
+        beach_name: Name of the beach
+        date: Date in YYYY-MM-DD format
+        cache_key: Key for the in-process response cache
         
-        try:
-            cache_save_response = requests.post("http://localhost:5001/api/surf", json=cache_data, timeout=2)
-            if cache_save_response.status_code == 200:
-                print("💾 Cached complete response in MongoDB")
-        except Exception as e:
-            print(f"⚠️ Could not cache in MongoDB: {e}")
+    Returns:
+        JSON response body for the frontend
+    """
+    # Check MongoDB cache first for complete response (industry standard: cache the full resource),
+    # unless the circuit breaker is open after repeated cache failures
+    if time.monotonic() >= _cache_breaker["open_until"]:
+        rendered = await _read_cached_response(beach_name, date)
+        if rendered is not None:
+            _response_cache[cache_key] = rendered
+            return rendered
+    
+    # Cache miss - fetch fresh data and generate AI analysis
+    logger.info("🌊 Fetching fresh data from Stormglass API")
+    data_fetcher = app.state.data_fetcher
+    summarizer = app.state.summarizer
+    
+    # Get surf data for AI analysis; this fetches weather and tide concurrently and
+    # caches both, so it runs first and the conversions below are cache hits
+    surf_data_result = await asyncio.to_thread(data_fetcher.fetch_surf_data, beach_name, target_date=date)
+    surf_data_for_ai = surf_data_result.get('data', {}) if 'error' not in surf_data_result else {}
+    
+    # Get current conditions, hourly forecast and AI analysis concurrently
+    loop = asyncio.get_running_loop()
+    current_conditions_result, hourly_forecast_result, (ai_analysis_text, break_specific_conditions, one_sentence_summary) = await asyncio.gather(
+        asyncio.to_thread(data_fetcher.get_current_conditions, beach_name, target_date=date),
+        asyncio.to_thread(data_fetcher.get_hourly_conditions, beach_name, target_date=date),
+        loop.run_in_executor(app.state.llm_pool, partial(summarizer.get_combined, beach_name, surf_data_for_ai, date))
+    )
+    
+    current_conditions = current_conditions_result.get('current_conditions', {})
+    hourly_forecast = hourly_forecast_result.get('hourly_conditions', [])
+    best_surf_times = summarizer.parse_best_times_from_analysis(ai_analysis_text)
+    
+    # Tide data is served by /api/tide, but keep what was fetched alongside the weather
+    tide_data = surf_data_result.get('tide_data')
+    if tide_data and 'error' not in tide_data:
+        _tide_cache[cache_key] = _json_dumps(tide_data)
+    
+    # Render the response once; it is cached in-process and stored with the MongoDB document
+    response = {
+        "beachName": beach_name,
+        "date": date,
+        "currentConditions": current_conditions if isinstance(current_conditions, dict) else {},
+        "hourlyForecast": hourly_forecast,
+        "bestSurfTimes": best_surf_times,
+        "breakSpecificConditions": break_specific_conditions,
+        "aiAnalysis": ai_analysis_text,
+        "oneSentenceSummary": one_sentence_summary
+    }
+    rendered = _json_dumps(response)
+    _response_cache[cache_key] = rendered
+    
+    # Cache complete response in MongoDB (using schema field names)
+    cache_data = {
+        "beach_name": beach_name,
+        "date": date,
+        "current_conditions": current_conditions,
+        "hourly_conditions": hourly_forecast,  # MongoDB schema uses hourly_conditions
+        "best_surf_times": best_surf_times,
+        "break_specific_conditions": break_specific_conditions,
+        "ai_analysis": {
+            "text": ai_analysis_text,
+            "overall_rating": "N/A",
+            "best_times": "N/A",
+            "recommendations": "N/A",
+            "notable_changes": "N/A"
+        },
+        "one_sentence_summary": one_sentence_summary,
+        "rendered": rendered.decode('utf-8')
+    }
+    
+    try:
+        app.state.cache_queue.put_nowait(cache_data)
+    except asyncio.QueueFull:
+        logger.warning("⚠️ Could not cache in MongoDB: write queue is full")
+    
+    return rendered
+
+
+@app.get("/")
+async def root():
+    return {"message": "🌊 WaveWatch API is running!", "version": "1.0.0"}
+
+async def _get_surf_response(beach_name: str, date: str) -> bytes:
+    """
+    Get surf data for a specific beach and date as a JSON response body
+    """
+    try:
+        # Serve recently built responses without a round-trip to the cache service
+        cache_key = (beach_name, date)
+        rendered = _response_cache.get(cache_key)
+        if rendered is not None:
+            return rendered
         
-        # Return response
-        return {
-            "beachName": beach_name,
-            "date": date,
-            "currentConditions": current_conditions if isinstance(current_conditions, dict) else {},
-            "hourlyForecast": hourly_forecast,
-            "bestSurfTimes": best_surf_times,
-            "breakSpecificConditions": break_specific_conditions,
-            "aiAnalysis": ai_analysis_text,
-            "oneSentenceSummary": one_sentence_summary,
-            "tideData": tide_data
-        }
+        # Coalesce concurrent misses for the same key so only one build runs. The build is its
+        # own task, so a request that is cancelled (e.g. the client disconnects) does not
+        # cancel it for the other requests waiting on it
+        build = _inflight.get(cache_key)
+        if build is None:
+            build = asyncio.ensure_future(_build_surf_response(beach_name, date, cache_key))
+            _inflight[cache_key] = build
+            build.add_done_callback(partial(_finish_inflight, cache_key))
+        return await asyncio.shield(build)
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error fetching surf data: {str(e)}")
+        logger.exception("Error fetching surf data: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against a strong ETag, using the weak comparison
+    If-None-Match calls for: "*" matches anything, and the header may list several
+    tags, any of which may carry a W/ prefix (e.g. added by a proxy that recompressed)
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+@app.get("/api/surf/{beach_name}/{date}")
+async def get_surf_data(beach_name: str, date: _DatePath, request: Request):
+    """
+    Get surf data for a specific beach and date, answering 304 when the client's ETag matches
+    (the date must be a valid YYYY-MM-DD calendar date, anything else is answered with 422)
+    """
+    body = await _get_surf_response(beach_name, date.isoformat())
+    
+    # The hash only fingerprints the body, so it stays usable on FIPS-mode builds
+    etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
+    
+    return Response(content=body, media_type="application/json", headers=cache_headers)
+
+@app.get("/api/tide/{beach_name}/{date}")
+async def get_tide_data(beach_name: str, date: _DatePath):
+    """
+    Get NOAA tide data for a specific beach and date, fetched separately from the surf data
+    so the frontend can request both in parallel
+    """
+    date_str = date.isoformat()
+    cache_key = (beach_name, date_str)
+    body = _tide_cache.get(cache_key)
+    if body is None:
+        tide_data = await _fetch_tide_data(beach_name, date_str)
+        body = _json_dumps(tide_data)
+        if tide_data:
+            _tide_cache[cache_key] = body
+    
+    return Response(content=body, media_type="application/json")
+
 @app.get("/api/beaches")
 async def get_available_beaches():
     """
     Get list of available beaches
     """
-    return {
-        "beaches": list(data_fetcher.beach_coordinates.keys())
-    }
+    return Response(content=app.state.beaches, media_type="application/json")
 
 
 @app.get("/health")
@@ -184,10 +516,20 @@ async def health_check():
     """
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
+# Development entry point; production runs under gunicorn with gunicorn.conf.py
 if __name__ == "__main__":
-    print("🌊 Starting WaveWatch API server...")
-    print("📡 API will be available at: http://localhost:8001")
-    print("📚 API docs available at: http://localhost:8001/docs")
-    print("🔗 React frontend should connect to: http://localhost:8001")
+    logger.info("🌊 Starting WaveWatch API server...")
+    logger.info("📡 API will be available at: http://localhost:8001")
+    logger.info("📚 API docs available at: http://localhost:8001/docs")
+    logger.info("🔗 React frontend should connect to: http://localhost:8001")
     
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    # uvloop/httptools need uvicorn[standard]; multiple workers require the app as an import string.
+    # One worker by default for local development; use gunicorn.conf.py for production
+    uvicorn.run(
+        "surf_api:app",
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WAVEWATCH_WORKERS", "1"))
+    )
@@ -0,0 +1,19 @@
+"""Shared pytest fixtures for the WaveWatch test suite."""
+
+import os
+
+import pytest
+
+# The fetcher and summarizer refuse to start without API keys; tests never call the real services
+os.environ.setdefault('STORMGLASS_API_KEY', 'test-stormglass-key')
+os.environ.setdefault('GEMINI_API_KEY', 'test-gemini-key')
+
+from wavewatch.api.data_fetcher import StormglassDataFetcher
+
+
+@pytest.fixture
+def fetcher(tmp_path):
+    """A data fetcher whose SQLite cache lives in a temporary directory."""
+    data_fetcher = StormglassDataFetcher(api_key='test-stormglass-key', cache_file=str(tmp_path / 'surf_data_cache.db'))
+    yield data_fetcher
+    data_fetcher.close()
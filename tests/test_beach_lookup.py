@@ -0,0 +1,37 @@
+"""Tests for beach name to coordinate lookups."""
+
+import pytest
+
+MALIBU = (34.0259, -118.7798)
+TRESTLES = (33.3703, -117.5681)
+
+
+@pytest.mark.parametrize('name', ['malibu', 'Malibu', '  MALIBU  '])
+def test_exact_match_ignores_case_and_padding(fetcher, name):
+    assert fetcher._get_beach_coordinates(name) == MALIBU
+
+
+def test_exact_match_collapses_inner_whitespace(fetcher):
+    assert fetcher._get_beach_coordinates('Venice   Beach') == (33.9850, -118.4695)
+
+
+def test_partial_name_matches_start_of_known_beach(fetcher):
+    assert fetcher._get_beach_coordinates('huntington') == (33.6595, -117.9988)
+
+
+def test_known_beach_at_start_of_longer_name(fetcher):
+    assert fetcher._get_beach_coordinates('malibu pier') == MALIBU
+
+
+def test_distinctive_word_matches_its_beach(fetcher):
+    assert fetcher._get_beach_coordinates('onofre') == TRESTLES
+
+
+@pytest.mark.parametrize('name', ['beach', 'state', 'nowhere special'])
+def test_generic_or_unknown_names_do_not_match(fetcher, name):
+    assert fetcher._get_beach_coordinates(name) is None
+
+
+def test_every_known_beach_resolves_to_its_own_coordinates(fetcher):
+    for name, coords in fetcher.beach_coordinates.items():
+        assert fetcher._get_beach_coordinates(name) == coords
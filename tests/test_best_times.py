@@ -0,0 +1,67 @@
+"""Tests for parsing the "Best Time to Surf" section of an analysis."""
+
+from wavewatch.llm._parse import parse_best_times
+
+ANALYSIS = """1. **Overall Surf Rating:** 72/100 - Clean conditions with a building swell.
+
+2. **Best Time to Surf:** 8:00 AM - 9:00 AM
+    *   **Rating:** 85/100
+    *   **Wave Height:** 4.2-4.8ft
+    *   **Wave Period:** 13.6s
+    *   **Wind Speed:** 0.6-1.2mph
+    *   **Explanation:** Light offshore winds line up with the rising tide.
+
+The swell angle suits the reef best in the morning.
+
+3. **Specific Recommendations:** Bring a longboard.
+"""
+
+
+def test_parses_all_fields():
+    assert parse_best_times(ANALYSIS) == [{
+        'time': '8:00 AM - 9:00 AM',
+        'rating': 85,
+        'wave_height_range': '4.2-4.8ft',
+        'period': 14,
+        'wind_speed_range': '0.6-1.2mph',
+        'reason': 'Light offshore winds line up with the rising tide.\n\nThe swell angle suits the reef best in the morning.'
+    }]
+
+
+def test_time_on_the_line_after_the_heading():
+    text = "2. **Best Time to Surf:**\n7:00 AM - 8:00 AM\n* Rating: 60\n3. **Specific Recommendations:** None"
+
+    entry, = parse_best_times(text)
+    assert entry['time'] == '7:00 AM - 8:00 AM'
+    assert entry['rating'] == 60
+
+
+def test_inline_rating_on_the_heading_line():
+    entry, = parse_best_times("2. **Best Time to Surf:** 7 AM - 8 AM (Rating: 85)\n3. **Specific Recommendations:** None")
+
+    assert entry['time'] == '7 AM - 8 AM'
+    assert entry['rating'] == 85
+
+
+def test_inline_score_on_the_time_line():
+    entry, = parse_best_times("**Best Time to Surf:**\n6:00 AM - 7:00 AM, score 91/100\n* Wave Height: 3ft")
+
+    assert entry['rating'] == 91
+    assert entry['wave_height_range'] == '3ft'
+
+
+def test_section_ends_at_the_next_heading():
+    text = "2. **Best Time to Surf:** 8:00 AM - 9:00 AM\n3. **Specific Recommendations:**\n* Rating: 40"
+
+    assert parse_best_times(text)[0]['rating'] is None
+
+
+def test_missing_section_or_time_yields_nothing():
+    assert parse_best_times("1. **Overall Surf Rating:** 50/100") == []
+    assert parse_best_times("2. **Best Time to Surf:** Flat all day\n* Rating: 10") == []
+
+
+def test_results_can_be_modified_without_affecting_the_cache():
+    parse_best_times(ANALYSIS)[0]['rating'] = 0
+
+    assert parse_best_times(ANALYSIS)[0]['rating'] == 85
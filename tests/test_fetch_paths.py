@@ -0,0 +1,148 @@
+"""Tests that the sync and async surf data fetches behave the same."""
+
+import asyncio
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+WEATHER = {'hours': [{'time': '2024-01-05T00:00:00+00:00', 'waveHeight': {'noaa': 1.2}}], 'meta': {}}
+TIDE = {'station_id': '9410660', 'tide_conditions': []}
+
+
+class _FakeResponse:
+    def __init__(self, status, payload):
+        self.status_code = status
+        self.content = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+
+
+class _FakeSession:
+    def __init__(self, status, payload):
+        self.response = _FakeResponse(status, payload)
+
+    def get(self, url, **kwargs):
+        return self.response
+
+    def close(self):
+        pass
+
+
+def _fetch_both(fetcher, monkeypatch, status, payload):
+    """Run the same fetch through the sync and async paths, clearing the cache in between."""
+    monkeypatch.setattr(fetcher, '_session', _FakeSession(status, payload))
+    monkeypatch.setattr(fetcher, '_get_noaa_tide_data', lambda beach_name, target_date=None: TIDE)
+    sync_result = fetcher.fetch_surf_data('malibu', target_date='2024-01-05')
+    fetcher._cache_db.execute('DELETE FROM cache')
+
+    response = _FakeSession(status, payload).response
+
+    async def fake_weather(params):
+        return response.status_code, response.content
+
+    async def fake_tide(beach_name, target_date=None):
+        return TIDE
+
+    monkeypatch.setattr(fetcher, '_aget_weather', fake_weather)
+    monkeypatch.setattr(fetcher, '_aget_noaa_tide_data', fake_tide)
+
+    async def run():
+        try:
+            return await fetcher.afetch_surf_data('malibu', target_date='2024-01-05')
+        finally:
+            await fetcher.aclose()
+
+    return sync_result, asyncio.run(run())
+
+
+def _without_timestamp(result):
+    return {key: value for key, value in result.items() if key != 'timestamp'}
+
+
+def test_successful_fetches_match_and_are_cached(fetcher, monkeypatch):
+    sync_result, async_result = _fetch_both(fetcher, monkeypatch, 200, WEATHER)
+
+    assert _without_timestamp(sync_result) == _without_timestamp(async_result)
+    assert async_result['data'] == WEATHER
+    assert async_result['tide_data'] == TIDE
+    assert async_result['cached'] is False
+    assert fetcher.fetch_surf_data('malibu', target_date='2024-01-05')['cached'] is True
+
+
+def test_failed_fetches_match_and_are_not_cached(fetcher, monkeypatch):
+    sync_result, async_result = _fetch_both(fetcher, monkeypatch, 402, b'Payment Required')
+
+    assert sync_result == async_result
+    assert async_result['error'] == 'API request failed with status 402: Payment Required'
+    assert fetcher._load_cache(fetcher._cache_key(34.0259, -118.7798, '2024-01-05')) is None
+
+
+def test_unknown_beach_is_reported_by_both_paths(fetcher):
+    async def run():
+        try:
+            return await fetcher.afetch_surf_data('nowhere special')
+        finally:
+            await fetcher.aclose()
+
+    assert fetcher.fetch_surf_data('nowhere special') == asyncio.run(run())
+
+
+def test_each_event_loop_gets_its_own_session(fetcher):
+    loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+    try:
+        first, again, other = (
+            loop.run_until_complete(fetcher._get_async_session()) for loop in (loops[0], loops[0], loops[1])
+        )
+
+        assert first is again
+        assert other is not first
+        assert not first.closed
+
+        for loop in loops:
+            loop.run_until_complete(fetcher.aclose())
+        assert first.closed and other.closed
+    finally:
+        for loop in loops:
+            loop.close()
+
+
+def test_sessions_only_request_decodable_encodings(fetcher):
+    from wavewatch.api import data_fetcher
+
+    expected = {'gzip', 'deflate'} | ({'br'} if data_fetcher.brotli is not None else set())
+
+    async def async_header():
+        try:
+            return (await fetcher._get_async_session()).headers['Accept-Encoding']
+        finally:
+            await fetcher.aclose()
+
+    for header in (fetcher._session.headers['Accept-Encoding'], asyncio.run(async_header())):
+        assert set(header.split(', ')) == expected
+
+
+def test_batch_shares_requests_between_beaches(fetcher, monkeypatch):
+    weather_calls = []
+    tide_calls = []
+
+    class CountingSession(_FakeSession):
+        def get(self, url, **kwargs):
+            weather_calls.append((kwargs['params']['lat'], kwargs['params']['lng']))
+            return self.response
+
+    def fake_tide(beach_name, target_date=None):
+        tide_calls.append(beach_name)
+        return TIDE
+
+    monkeypatch.setattr(fetcher, '_session', CountingSession(200, WEATHER))
+    monkeypatch.setattr(fetcher, '_get_noaa_tide_data', fake_tide)
+
+    # trestles and lowers share coordinates; malibu shares trestles' tide station
+    beaches = [('trestles', '2024-01-05'), ('lowers', '2024-01-05'), ('malibu', '2024-01-05'), ('nowhere special', None)]
+    results = fetcher.fetch_surf_data_batch(beaches)
+
+    assert sorted(weather_calls) == sorted({fetcher._get_beach_coordinates(name) for name in ('trestles', 'malibu')})
+    assert len(tide_calls) == 1
+    assert results[('lowers', '2024-01-05')]['beach_name'] == 'lowers'
+    assert results[('lowers', '2024-01-05')]['data'] == WEATHER
+    assert 'error' in results[('nowhere special', None)]
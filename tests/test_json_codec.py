@@ -0,0 +1,19 @@
+"""Tests for the optional-orjson JSON helpers used by the data fetcher."""
+
+from wavewatch.api import data_fetcher
+
+
+def test_json_round_trip():
+    payload = {'hours': [{'time': '2025-01-01T00:00:00+00:00', 'waveHeight': {'noaa': 1.2}}]}
+    
+    assert data_fetcher._json_loads(data_fetcher._json_dumps(payload)) == payload
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch):
+    payload = {'name': 'pleasure point', 'coords': [36.9514, -122.0256], 'tide': None}
+    encoded = data_fetcher._json_dumps(payload)
+    
+    monkeypatch.setattr(data_fetcher, 'orjson', None)
+    
+    assert data_fetcher._json_dumps(payload) == encoded
+    assert data_fetcher._json_loads(encoded) == payload
@@ -0,0 +1,55 @@
+"""Tests for streaming the surf conditions analysis."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from wavewatch.llm.summarizer import SurfSummarizer
+
+SURF_DATA = {
+    'current_conditions': {'wave_height': 3.3},
+    'hourly_conditions': [{'time': '2024-01-05T06:00:00+00:00', 'wave_height': 3.3}]
+}
+
+
+class _FakeModels:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.prompts = []
+
+    def generate_content_stream(self, model, contents):
+        self.prompts.append(contents)
+        for chunk in self.chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield SimpleNamespace(text=chunk)
+
+
+@pytest.fixture
+def summarizer():
+    surf_summarizer = SurfSummarizer(api_key='test-gemini-key')
+    yield surf_summarizer
+    surf_summarizer.close()
+
+
+def _use_chunks(summarizer, chunks):
+    models = _FakeModels(chunks)
+    summarizer.client = SimpleNamespace(models=models)
+    return models
+
+
+def test_analysis_streams_each_chunk(summarizer):
+    models = _use_chunks(summarizer, ['Best Time ', None, 'to Surf: 8:00 AM - 9:00 AM'])
+
+    chunks = list(summarizer.stream_surf_conditions('malibu', SURF_DATA, '2024-01-05', use_break_specific=False))
+
+    assert chunks == ['Best Time ', 'to Surf: 8:00 AM - 9:00 AM']
+    assert 'malibu' in models.prompts[0] and '2024-01-05' in models.prompts[0]
+
+
+def test_stream_failure_ends_with_an_error_message(summarizer):
+    _use_chunks(summarizer, ['Partial ', RuntimeError('quota exceeded')])
+
+    chunks = list(summarizer.stream_surf_conditions('malibu', SURF_DATA, use_break_specific=False))
+
+    assert chunks == ['Partial ', 'Error generating surf conditions: quota exceeded']
@@ -0,0 +1,213 @@
+"""Tests for the surf API routes and their request coalescing."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip('motor')
+
+import surf_api
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture(autouse=True)
+def clear_response_caches():
+    surf_api._response_cache.clear()
+    surf_api._inflight.clear()
+    yield
+    surf_api._response_cache.clear()
+    surf_api._inflight.clear()
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    """Replace the response build with a slow fake, recording each call."""
+    calls = []
+
+    async def fake_build(beach_name, date, cache_key):
+        calls.append(cache_key)
+        await asyncio.sleep(0.05)
+        if beach_name == 'broken':
+            raise RuntimeError('build failed')
+        return f'{beach_name} {date}'.encode()
+
+    monkeypatch.setattr(surf_api, '_build_surf_response', fake_build)
+    return calls
+
+
+def test_concurrent_misses_share_one_build(builds):
+    async def scenario():
+        return await asyncio.gather(*(surf_api._get_surf_response('malibu', '2024-01-05') for _ in range(5)))
+
+    assert _run(scenario()) == [b'malibu 2024-01-05'] * 5
+    assert builds == [('malibu', '2024-01-05')]
+    assert surf_api._inflight == {}
+
+
+def test_cancelled_request_does_not_cancel_the_shared_build(builds):
+    async def scenario():
+        owner = asyncio.ensure_future(surf_api._get_surf_response('malibu', '2024-01-05'))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(surf_api._get_surf_response('malibu', '2024-01-05'))
+        await asyncio.sleep(0)
+        owner.cancel()
+        return await waiter, owner.cancelled()
+
+    assert _run(scenario()) == (b'malibu 2024-01-05', True)
+    assert len(builds) == 1
+    assert surf_api._inflight == {}
+
+
+def test_failed_build_reaches_every_waiter_and_is_not_reused(builds):
+    async def scenario():
+        return await asyncio.gather(
+            *(surf_api._get_surf_response('broken', '2024-01-05') for _ in range(3)),
+            return_exceptions=True
+        )
+
+    results = _run(scenario())
+    assert [getattr(result, 'status_code', None) for result in results] == [500] * 3
+    assert surf_api._inflight == {}
+
+    _run(scenario())
+    assert len(builds) == 2
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """A test client whose surf responses come from a fixed body (no lifespan, so no services)."""
+    from fastapi.testclient import TestClient
+
+    async def fake_response(beach_name, date):
+        return b'{"beach":"%s","date":"%s"}' % (beach_name.encode(), date.encode())
+
+    monkeypatch.setattr(surf_api, '_get_surf_response', fake_response)
+    return TestClient(surf_api.app)
+
+
+def test_surf_response_carries_an_etag(client):
+    response = client.get('/api/surf/malibu/2024-01-05')
+
+    assert response.status_code == 200
+    assert response.json() == {'beach': 'malibu', 'date': '2024-01-05'}
+    assert response.headers['etag'].startswith('"')
+    assert response.headers['cache-control'] == 'public, max-age=60'
+
+
+def test_matching_etag_gets_304_without_a_body(client):
+    etag = client.get('/api/surf/malibu/2024-01-05').headers['etag']
+
+    response = client.get('/api/surf/malibu/2024-01-05', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.content == b''
+    assert response.headers['etag'] == etag
+
+
+@pytest.mark.parametrize('header', ['*', '"stale", {etag}', 'W/{etag}', '"stale" , W/{etag}'])
+def test_etag_lists_wildcards_and_weak_tags_get_304(client, header):
+    etag = client.get('/api/surf/malibu/2024-01-05').headers['etag']
+
+    response = client.get('/api/surf/malibu/2024-01-05', headers={'If-None-Match': header.format(etag=etag)})
+
+    assert response.status_code == 304
+
+
+def test_stale_etag_gets_the_full_response(client):
+    etag = client.get('/api/surf/malibu/2024-01-05').headers['etag']
+
+    response = client.get('/api/surf/malibu/2024-01-06', headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.headers['etag'] != etag
+
+
+def test_tide_responses_are_encoded_once_and_cached(client, monkeypatch):
+    calls = []
+
+    async def fake_tide(beach_name, date):
+        calls.append((beach_name, date))
+        return {'station_id': '9410660', 'tide_conditions': [{'time': '2024-01-05T04:12:00+00:00', 'tide': 4.92}]}
+
+    monkeypatch.setattr(surf_api, '_fetch_tide_data', fake_tide)
+    surf_api._tide_cache.clear()
+
+    first = client.get('/api/tide/malibu/2024-01-05')
+    second = client.get('/api/tide/malibu/2024-01-05')
+
+    assert first.headers['content-type'] == 'application/json'
+    assert first.json()['tide_conditions'][0]['tide'] == 4.92
+    assert second.content == first.content
+    assert calls == [('malibu', '2024-01-05')]
+    surf_api._tide_cache.clear()
+
+
+@pytest.mark.parametrize('date', ['0', '1704412800', '2024-01-05T00:00:00', '2024-1-05', '2024-02-30', 'today'])
+@pytest.mark.parametrize('route', ['/api/surf', '/api/tide'])
+def test_dates_other_than_yyyy_mm_dd_are_rejected(client, route, date):
+    assert client.get(f'{route}/malibu/{date}').status_code == 422
+
+
+class _FakeCollection:
+    """Records bulk writes the way the cache writer issues them."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def bulk_write(self, operations, ordered=True):
+        self.batches.append([(operation._filter, operation._doc) for operation in operations])
+
+
+def test_cache_writer_batches_queued_documents_and_flushes_on_stop():
+    collection = _FakeCollection()
+
+    async def scenario():
+        cache_queue = asyncio.Queue()
+        writer = asyncio.create_task(surf_api._cache_writer(cache_queue, collection))
+        for day in range(1, 4):
+            cache_queue.put_nowait({'beach_name': 'Malibu ', 'date': f'2024-01-0{day}', 'rendered': '{}'})
+        await asyncio.sleep(surf_api._CACHE_BATCH_MAX_WAIT * 2)
+        cache_queue.put_nowait({'beach_name': 'pipeline', 'date': '2024-01-05', 'rendered': '{}'})
+        cache_queue.put_nowait(None)
+        await asyncio.wait_for(writer, 1)
+
+    _run(scenario())
+
+    assert [len(batch) for batch in collection.batches] == [3, 1]
+    query, document = collection.batches[0][0]
+    assert query == {'beach_name': 'malibu', 'date': '2024-01-01'}
+    assert document['beach_name'] == 'malibu'
+    assert document['expires_at'] > document['created_at']
+
+
+class _SlowCollection:
+    """Answers cache reads with a stored rendered response after a delay."""
+
+    def __init__(self, delay, rendered):
+        self.delay = delay
+        self.rendered = rendered
+
+    async def find_one(self, query, projection=None):
+        await asyncio.sleep(self.delay)
+        return {'_id': 1, 'rendered': self.rendered}
+
+
+def test_slow_but_successful_cache_read_is_a_hit(monkeypatch):
+    # Well over the old 150 ms budget, as a read from a remote cluster can be
+    monkeypatch.setattr(surf_api.app.state, 'surf_collection', _SlowCollection(0.3, '{"cached":true}'), raising=False)
+    monkeypatch.setitem(surf_api._cache_breaker, 'fails', 0)
+
+    async def fail_fetch(*args, **kwargs):
+        raise AssertionError('cache hit expected')
+
+    monkeypatch.setattr(surf_api.asyncio, 'to_thread', fail_fetch)
+
+    body = _run(surf_api._build_surf_response('malibu', '2024-01-05', ('malibu', '2024-01-05')))
+
+    assert body == b'{"cached":true}'
+    assert surf_api._response_cache[('malibu', '2024-01-05')] == body
+    assert surf_api._cache_breaker['fails'] == 0
+
@@ -0,0 +1,61 @@
+"""Tests for the SQLite surf data cache."""
+
+import time
+
+from wavewatch.api.data_fetcher import StormglassDataFetcher
+
+WEATHER = {
+    'hours': [{'time': '2024-01-05T00:00:00+00:00', 'waveHeight': {'noaa': 1.2}}],
+    'meta': {'lat': 34.0259, 'lng': -118.7798}
+}
+TIDE = {'station_id': '9410660', 'tides': [{'time': '04:12', 'type': 'HIGH', 'height': 4.9}]}
+
+
+def test_cache_round_trip(fetcher):
+    timestamp = time.time()
+    fetcher._save_cache('34.0259,-118.7798', {'data': WEATHER, 'tide_data': TIDE, 'timestamp': timestamp})
+
+    assert fetcher._load_cache('34.0259,-118.7798') == {'data': WEATHER, 'tide_data': TIDE, 'timestamp': timestamp}
+    assert fetcher._load_cache('34.0259,-118.7798_2024-01-05') is None
+
+
+def test_expired_entries_are_not_loaded(fetcher):
+    stale = time.time() - fetcher.cache_expiry - 1
+    fetcher._save_cache('key', {'data': WEATHER, 'tide_data': {}, 'timestamp': stale})
+
+    assert fetcher._load_cache('key') is None
+
+
+def test_cache_persists_across_fetchers(tmp_path):
+    cache_file = str(tmp_path / 'nested' / 'surf_data_cache.db')
+    first = StormglassDataFetcher(api_key='test-stormglass-key', cache_file=cache_file)
+    first._save_cache('key', {'data': WEATHER, 'tide_data': {}, 'timestamp': time.time()})
+    first.close()
+
+    second = StormglassDataFetcher(api_key='test-stormglass-key', cache_file=cache_file)
+    try:
+        assert second._load_cache('key')['data'] == WEATHER
+    finally:
+        second.close()
+
+
+def test_cache_path_comes_from_environment(tmp_path, monkeypatch):
+    cache_file = str(tmp_path / 'env' / 'cache.db')
+    monkeypatch.setenv('WAVEWATCH_CACHE_DB', cache_file)
+
+    data_fetcher = StormglassDataFetcher(api_key='test-stormglass-key')
+    try:
+        assert data_fetcher.cache_file == cache_file
+    finally:
+        data_fetcher.close()
+
+
+def test_default_cache_path_is_in_user_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv('WAVEWATCH_CACHE_DB', raising=False)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+
+    data_fetcher = StormglassDataFetcher(api_key='test-stormglass-key')
+    try:
+        assert data_fetcher.cache_file == str(tmp_path / 'wavewatch' / 'surf_data_cache.db')
+    finally:
+        data_fetcher.close()
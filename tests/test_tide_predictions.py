@@ -0,0 +1,83 @@
+"""Tests for NOAA tide prediction parsing and memoization."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from wavewatch.api.data_fetcher import _parse_noaa_ts
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+        self.status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSession:
+    """Stands in for requests.Session, replaying one payload and counting calls."""
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        return _FakeResponse(self.payload)
+
+    def close(self):
+        pass
+
+
+def _use_session(fetcher, monkeypatch, payload):
+    session = _FakeSession(payload)
+    monkeypatch.setattr(fetcher, '_session', session)
+    return session
+
+
+def test_predictions_are_parsed_and_memoized(fetcher, monkeypatch):
+    session = _use_session(fetcher, monkeypatch, {'predictions': [
+        {'t': '2024-01-05 04:12', 'type': 'h', 'v': '1.5'},
+        {'t': '2024-01-05 10:30', 'type': 'l', 'v': '-0.2'},
+    ]})
+
+    first = fetcher._fetch_predictions('9410660', '20240105')
+    second = fetcher._fetch_predictions('9410660', '20240105')
+
+    assert first == (('2024-01-05 04:12', 'H', 1.5), ('2024-01-05 10:30', 'L', -0.2))
+    assert second == first
+    assert session.calls == 1
+
+
+def test_empty_predictions_are_not_memoized(fetcher, monkeypatch):
+    session = _use_session(fetcher, monkeypatch, {'predictions': []})
+
+    assert fetcher._fetch_predictions('9410660', '20240105') == ()
+    assert fetcher._fetch_predictions('9410660', '20240105') == ()
+    assert session.calls == 2
+
+
+def test_error_payloads_are_not_memoized(fetcher, monkeypatch):
+    session = _use_session(fetcher, monkeypatch, {'error': {'message': 'No Predictions data was found.'}})
+
+    fetcher._fetch_predictions('9410660', '20240105')
+    fetcher._fetch_predictions('9410660', '20240105')
+    assert session.calls == 2
+
+
+@pytest.mark.parametrize('timestamp, expected', [
+    ('2024-01-05 04:12', datetime(2024, 1, 5, 4, 12)),
+    ('2024-01-05 04:12:37', datetime(2024, 1, 5, 4, 12, 37)),
+    ('2024-12-31 23:59', datetime(2024, 12, 31, 23, 59)),
+])
+def test_parse_noaa_ts_matches_strptime(timestamp, expected):
+    fmt = '%Y-%m-%d %H:%M:%S' if len(timestamp) > 16 else '%Y-%m-%d %H:%M'
+    assert _parse_noaa_ts(timestamp) == expected == datetime.strptime(timestamp, fmt)
+
+
+def test_parse_noaa_ts_rejects_malformed_timestamps():
+    with pytest.raises(ValueError):
+        _parse_noaa_ts('2024-13-05 04:12')
@@ -0,0 +1,63 @@
+"""Tests for metric to imperial conversions in the hourly and current conditions."""
+
+
+def _hour(**metrics):
+    hour = {'time': '2024-01-05T00:00:00+00:00'}
+    hour.update({key: {'noaa': value} for key, value in metrics.items()})
+    return hour
+
+
+def _result(hours):
+    return {
+        'beach_name': 'malibu',
+        'coordinates': {'lat': 34.0259, 'lng': -118.7798},
+        'data': {'hours': hours}
+    }
+
+
+def test_hourly_conditions_round_like_python(fetcher, monkeypatch):
+    hours = [_hour(waterTemperature=20.25, airTemperature=20.25, waveHeight=1.0)]
+    monkeypatch.setattr(fetcher, 'fetch_surf_data', lambda *args, **kwargs: _result(hours))
+
+    hour = fetcher.get_hourly_conditions('malibu')['hourly_conditions'][0]
+
+    # 20.25 C is 68.45 F, which np.round would round half-to-even down to 68.4
+    assert hour['water_temperature'] == 68.5
+    assert hour['air_temperature'] == 68.5
+    assert hour['wave_height'] == 3.3
+
+
+def test_missing_hourly_metrics_are_reported_as_na(fetcher, monkeypatch):
+    hours = [_hour(waveHeight=1.0)]
+    monkeypatch.setattr(fetcher, 'fetch_surf_data', lambda *args, **kwargs: _result(hours))
+
+    hour = fetcher.get_hourly_conditions('malibu')['hourly_conditions'][0]
+
+    assert hour['wind_speed'] == 'N/A'
+    assert hour['water_temperature'] == 'N/A'
+    assert hour['visibility'] == 'N/A'
+
+
+def test_current_conditions_round_like_python(fetcher):
+    hour = _hour(waterTemperature=20.25, airTemperature=20.25, waveHeight=1.0, windSpeed=2.0, visibility=10.0)
+
+    conditions = fetcher._current_conditions_from_result(_result([hour]), 0)['current_conditions']
+
+    assert conditions['water_temperature'] == 68.5
+    assert conditions['air_temperature'] == 68.5
+    assert conditions['wave_height'] == 3.3
+    assert conditions['wind_speed'] == 4.5
+    assert conditions['visibility'] == 6.2
+    assert conditions['humidity'] == 'N/A'
+
+
+def test_prompt_hours_round_like_python():
+    from wavewatch.llm.summarizer import _convert_hours
+
+    converted, = _convert_hours([_hour(waterTemperature=20.25, airTemperature=0, waveHeight=1.0)])
+
+    assert converted.water_f == 68.5
+    assert converted.wh_ft == 3.3
+    # Missing and zero readings are treated as unavailable
+    assert converted.air_f is None
+    assert converted.ws_mph is None
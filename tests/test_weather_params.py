@@ -0,0 +1,54 @@
+"""Tests for the Stormglass request window built by _weather_params."""
+
+import time
+from datetime import datetime, timezone
+
+from wavewatch.api import data_fetcher
+
+
+def test_today_window_spans_the_current_utc_day(fetcher, monkeypatch):
+    # 2024-01-05 13:45:10 UTC
+    monkeypatch.setattr(data_fetcher.time, 'time', lambda: 1704462310.5)
+
+    params = fetcher._weather_params(34.0259, -118.7798)
+
+    assert params['start'] == 1704412800  # 2024-01-05 00:00:00 UTC
+    assert params['end'] == 1704412800 + 86399
+    assert params['lat'] == 34.0259 and params['lng'] == -118.7798
+    assert params['source'] == 'noaa'
+
+
+def test_target_date_window_spans_that_local_day(fetcher):
+    params = fetcher._weather_params(34.0259, -118.7798, '2024-01-05')
+
+    assert params['start'] == int(datetime(2024, 1, 5).timestamp())
+    assert params['end'] == int(datetime(2024, 1, 5, 23, 59, 59).timestamp())
+
+
+def test_target_date_accepts_datetime(fetcher):
+    as_string = fetcher._weather_params(0.0, 0.0, '2024-01-05')
+    as_datetime = fetcher._weather_params(0.0, 0.0, datetime(2024, 1, 5, 15, 30))
+
+    assert (as_datetime['start'], as_datetime['end']) == (as_string['start'], as_string['end'])
+
+
+def test_today_tides_use_the_same_utc_day_as_the_weather(fetcher, monkeypatch):
+    # 2024-01-05 00:00:30 UTC is still 2024-01-04 in Los Angeles
+    frozen = 1704412830
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls.fromtimestamp(frozen, tz)
+
+    monkeypatch.setenv('TZ', 'America/Los_Angeles')
+    time.tzset()
+    monkeypatch.setattr(data_fetcher.time, 'time', lambda: frozen)
+    monkeypatch.setattr(data_fetcher, 'datetime', FrozenDatetime)
+    try:
+        weather_day = datetime.fromtimestamp(fetcher._weather_params(0.0, 0.0)['start'], timezone.utc)
+
+        assert fetcher._tide_date_str(None) == weather_day.strftime('%Y%m%d') == '20240105'
+    finally:
+        monkeypatch.undo()
+        time.tzset()